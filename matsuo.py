@@ -1,7 +1,13 @@
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 from bs4 import BeautifulSoup
 
 START_URL = "https://www.matsuocamera.net/"
+ITEM_SELECTOR = '[data-hook="product-item-root"]'
+LOAD_MORE_SELECTOR = 'button[data-hook="load-more-button"]'
+LOAD_MORE_TIMEOUT_MS = 5000
+MAX_STALLED_CLICKS = 2
+COUNT_ITEMS_JS = "s => document.querySelectorAll(s).length"
+ITEMS_GREW_JS = "([s, n]) => document.querySelectorAll(s).length > n"
 
 def scrape_all_pages():
     results = []
@@ -11,19 +17,30 @@ def scrape_all_pages():
             page = browser.new_page()
             page.goto(START_URL, timeout=60000)
 
-            # ページ下部までスクロールして「もっと見る」クリックループ
-            while True:
-                if page.locator('button[data-hook="load-more-button"]').is_visible():
-                    page.locator('button[data-hook="load-more-button"]').click()
-                    page.wait_for_timeout(1500)
-                else:
-                    break
+            # 「もっと見る」クリックループ
+            # 固定スリープではなく商品数の増加を待ち、2回連続で増えなければ打ち切り
+            load_more = page.locator(LOAD_MORE_SELECTOR)
+            prev = page.evaluate(COUNT_ITEMS_JS, ITEM_SELECTOR)
+            stalled = 0
+            while stalled < MAX_STALLED_CLICKS and load_more.is_visible():
+                load_more.click()
+                try:
+                    page.wait_for_function(
+                        ITEMS_GREW_JS,
+                        arg=[ITEM_SELECTOR, prev],
+                        timeout=LOAD_MORE_TIMEOUT_MS,
+                    )
+                except PlaywrightTimeoutError:
+                    pass
+                cur = page.evaluate(COUNT_ITEMS_JS, ITEM_SELECTOR)
+                stalled = stalled + 1 if cur == prev else 0
+                prev = cur
 
             html = page.content()
             browser.close()
 
         soup = BeautifulSoup(html, "html.parser")
-        product_blocks = soup.select('[data-hook="product-item-root"]')
+        product_blocks = soup.select(ITEM_SELECTOR)
 
         for block in product_blocks:
             name_tag = block.select_one('[data-hook="product-item-name"]')
@@ -21,7 +21,9 @@ def scrape_matsuzakaya():
     
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
+        # コンテキストは1つだけ作成し、全ページ遷移で共有（Cookie・キャッシュ・接続を再利用）
+        context = browser.new_context(bypass_csp=True)
+        page = context.new_page()
         
         try:
             # トップページにアクセス
@@ -39,7 +41,6 @@ def scrape_matsuzakaya():
                 print("ボタンクリック成功")
             except Exception as e:
                 print(f"ボタンクリック失敗: {e}")
-                browser.close()
                 return 0
             
             # ページのHTMLを取得
@@ -126,7 +127,7 @@ def scrape_matsuzakaya():
         
         finally:
             try:
-                page.close()
+                context.close()
             except:
                 pass
             try:
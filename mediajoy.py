@@ -13,29 +13,82 @@ ADR-001: 静的サイト・requests+BeautifulSoup採用
 - Context: QAレポートで静的サイトと判定（JS5個・DOM静的）
 - Decision: Playwrightは不要、requestsで十分
 - Consequences: 高速・安定・リソース効率的
+
+ADR-002: BeautifulSoupパーサーにlxmlを優先採用
+=========================================
+- Status: ACCEPTED
+- Context: 非ネットワーク部分の処理時間はhtml.parser（純Python）が支配的
+- Decision: lxmlがインストール済みならlxml、未導入ならhtml.parserにフォールバック
+- Consequences: パース高速化、lxml未導入環境でも従来通り動作
+
+ADR-003: selectolax（lexbor）による商品抽出
+=========================================
+- Status: ACCEPTED
+- Context: select/get_textの呼び出しがパース後の処理時間の大半を占める
+- Decision: selectolax導入済みならC実装のCSSセレクタで抽出、
+  BeautifulSoup経路はフォールバックとして維持（MEDIAJOY_USE_SELECTOLAX=0で強制）。
+  lexborバックエンドを使用（selectolax>=0.3.17、1.0以降はModestバックエンドが廃止のため）
+- Consequences: 抽出処理の高速化、テキスト判定ロジックは両経路で共通
+
+ADR-004: 複数URLの並行取得
+=========================================
+- Status: ACCEPTED
+- Context: URLを逐次取得しており、取得時間がRTTの総和になる
+- Decision: asyncio.gatherで全URLを並行実行（hardoff.pyと同構成）。
+  HTTPは既存のrequests.Sessionをasyncio.to_threadで呼び出し、パースも同様に退避
+- Consequences: 取得時間は最も遅いURL程度に短縮、出力順はurl_index順を維持
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import json
 import logging
 import os
 import random
 import re
 import sys
+import tempfile
+import threading
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
 from enum import Enum, auto
-from typing import Any, Callable, Final, Generator, List, Optional, Protocol, Tuple, TypeVar
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Final, Generator, Iterator, List, Optional, Protocol, Tuple, TypeVar
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 
+try:
+    import lxml  # noqa: F401  BeautifulSoupのCパーサーとして使用
+    _HAS_LXML = True
+except ImportError:
+    _HAS_LXML = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser, LexborNode
+    _HAS_SELECTOLAX = True
+except ImportError:
+    _HAS_SELECTOLAX = False
+
 T = TypeVar("T")
 
+# 価格文字列に現れる区切り・通貨記号・空白を除去するテーブル
+_PRICE_TRANS: Final[Dict[int, None]] = str.maketrans(dict.fromkeys(",，¥￥円\u3000 \t\r\n"))
+_RE_WHITESPACE: Final[re.Pattern[str]] = re.compile(r'\s+')
+# 先頭の「数字+空白」（おすすめ順位）・商品名・価格を1パスで抽出
+# leadは所有的量指定子で確定させ、価格側へのバックトラックを防ぐ
+_RE_ITEM: Final[re.Pattern[str]] = re.compile(
+    r'\s*(?P<lead>\d+\s+)?+(?P<name>.*?)(?P<price>[\d,]+)\s*円', re.DOTALL)
+_RE_PRICE: Final[re.Pattern[str]] = re.compile(r'[\d,]+\s*円')
+# 「円」は1文字のためテキストノードを跨がない → 事前判定に使用
+_RE_YEN: Final[re.Pattern[str]] = re.compile(r'円')
+
 class LoggerProtocol(Protocol):
     def debug(self, msg: str, *args: Any, **kwargs: Any) -> None: ...
     def info(self, msg: str, *args: Any, **kwargs: Any) -> None: ...
@@ -50,10 +103,24 @@ class Constants:
     RETRY_BASE_DELAY_SECONDS: Final[float] = 1.0
     RETRY_MAX_DELAY_SECONDS: Final[float] = 30.0
     REQUEST_TIMEOUT_SECONDS: Final[int] = 30
+    HTTP_POOL_CONNECTIONS: Final[int] = 20
+    HTTP_POOL_MAXSIZE: Final[int] = 20
+    # 条件付きGETキャッシュの永続化先（未指定ならプロセス内のメモリのみ）
+    HTTP_CACHE_PATH: Final[str] = os.environ.get("MEDIAJOY_HTTP_CACHE", "")
     MIN_VALID_PRICE: Final[int] = 100
     MAX_VALID_PRICE: Final[int] = 50_000_000
     MIN_PRODUCT_NAME_LENGTH: Final[int] = 3
     USER_AGENT: Final[str] = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    HTML_PARSER: Final[str] = "lxml" if _HAS_LXML else "html.parser"
+    USE_SELECTOLAX: Final[bool] = _HAS_SELECTOLAX and os.environ.get("MEDIAJOY_USE_SELECTOLAX", "1") != "0"
+    SKIP_SECTION_KEYWORDS: Final[Tuple[str, ...]] = ("おすすめ", "人気", "ランキング")
+    FALLBACK_CONTAINER_TAGS: Final[Tuple[str, ...]] = ("li", "tr", "div", "section")
+    FALLBACK_MAX_ITEMS: Final[int] = 200
+
+@lru_cache(maxsize=4096)
+def _product_hash(name: str, price: int) -> str:
+    # 暗号学的強度は不要な識別子のため、MD5より高速なblake2b（4バイト=16進8文字）を使用
+    return hashlib.blake2b(f"{name}_{price}".encode("utf-8"), digest_size=4).hexdigest()
 
 class CircuitState(Enum):
     CLOSED = auto()
@@ -76,17 +143,17 @@ class ProductData:
     
     @classmethod
     def create(cls, name: str, price: int, url_index: int, rank: int = 0) -> ProductData:
-        product_hash = hashlib.md5(f"{name}_{price}".encode("utf-8")).hexdigest()[:8]
+        product_hash = _product_hash(name, price)
         return cls(name=name, price=price, url_index=url_index, product_hash=product_hash, rank=rank)
     
     def to_output_line(self) -> str:
         return f"{self.name} {self.price}円"
 
-@dataclass
+@dataclass(slots=True)
 class CircuitBreakerState:
     state: CircuitState = CircuitState.CLOSED
     failure_count: int = 0
-    last_failure_time: Optional[datetime] = None
+    last_failure_monotonic: float = 0.0  # time.monotonic()、0.0は未失敗
     half_open_call_count: int = 0
 
 @dataclass
@@ -143,7 +210,7 @@ class CircuitBreaker:
                  recovery_timeout: float = Constants.CB_RECOVERY_TIMEOUT_SECONDS,
                  logger: Optional[LoggerProtocol] = None):
         self._failure_threshold = failure_threshold
-        self._recovery_timeout = timedelta(seconds=recovery_timeout)
+        self._recovery_timeout_s = recovery_timeout
         self._logger = logger or StructuredLogger()
         self._state = CircuitBreakerState()
     
@@ -152,8 +219,8 @@ class CircuitBreaker:
         return self._state.state != CircuitState.OPEN
     
     def _check_transition(self) -> None:
-        if self._state.state == CircuitState.OPEN and self._state.last_failure_time:
-            if datetime.now() - self._state.last_failure_time >= self._recovery_timeout:
+        if self._state.state == CircuitState.OPEN and self._state.last_failure_monotonic:
+            if time.monotonic() - self._state.last_failure_monotonic >= self._recovery_timeout_s:
                 self._state.state = CircuitState.HALF_OPEN
                 self._state.half_open_call_count = 0
                 self._logger.info("Circuit Breaker: OPEN -> HALF_OPEN")
@@ -170,7 +237,7 @@ class CircuitBreaker:
     
     def record_failure(self) -> None:
         self._state.failure_count += 1
-        self._state.last_failure_time = datetime.now()
+        self._state.last_failure_monotonic = time.monotonic()
         if self._state.state == CircuitState.HALF_OPEN or self._state.failure_count >= self._failure_threshold:
             self._state.state = CircuitState.OPEN
             self._logger.warning("Circuit Breaker: -> OPEN")
@@ -195,6 +262,9 @@ class RetryPolicy:
         self._base_delay = base_delay
         self._max_delay = max_delay
         self._logger = logger or StructuredLogger()
+        # attempt毎の基準遅延を事前計算（attemptは1始まり）
+        self._delays: Tuple[float, ...] = tuple(
+            min(base_delay * (2 ** i), max_delay) for i in range(max(max_attempts, 1)))
     
     def execute_with_retry(self, operation: Callable[[], T], operation_name: str = "operation") -> T:
         last_exception: Optional[Exception] = None
@@ -205,57 +275,224 @@ class RetryPolicy:
                 last_exception = e
                 self._logger.warning(f"{operation_name}: 失敗 (attempt {attempt}/{self._max_attempts})")
                 if attempt < self._max_attempts:
-                    delay = min(self._base_delay * (2 ** (attempt - 1)), self._max_delay)
-                    delay += random.uniform(-delay * 0.25, delay * 0.25)
-                    time.sleep(max(0.1, delay))
+                    time.sleep(self._calculate_delay(attempt))
         raise RetryExhaustedException(f"{operation_name}: リトライ失敗") from last_exception
+    
+    async def execute_with_retry_async(self, operation: Callable[[], Awaitable[T]],
+                                       operation_name: str = "operation") -> T:
+        last_exception: Optional[Exception] = None
+        for attempt in range(1, self._max_attempts + 1):
+            try:
+                return await operation()
+            except Exception as e:
+                last_exception = e
+                self._logger.warning(f"{operation_name}: 失敗 (attempt {attempt}/{self._max_attempts})")
+                if attempt < self._max_attempts:
+                    await asyncio.sleep(self._calculate_delay(attempt))
+        raise RetryExhaustedException(f"{operation_name}: リトライ失敗") from last_exception
+    
+    def _calculate_delay(self, attempt: int) -> float:
+        delay = self._delays[attempt - 1]
+        # ±25%のジッター（random.uniformと同分布）
+        delay += (random.random() - 0.5) * 0.5 * delay
+        return max(0.1, delay)
+
+# ホットパスでのConstants属性解決を避けるためモジュール定数に束縛
+_MIN_VALID_PRICE: Final[int] = Constants.MIN_VALID_PRICE
+_MAX_VALID_PRICE: Final[int] = Constants.MAX_VALID_PRICE
+_MIN_PRODUCT_NAME_LENGTH: Final[int] = Constants.MIN_PRODUCT_NAME_LENGTH
 
 class ProductValidator:
     @staticmethod
     def validate_price(price_text: str) -> Optional[int]:
-        price_clean = re.sub(r'[^\d]', '', price_text)
-        try:
-            price = int(price_clean)
-            if Constants.MIN_VALID_PRICE <= price <= Constants.MAX_VALID_PRICE:
-                return price
-        except (ValueError, TypeError):
-            pass
+        price_clean = price_text.translate(_PRICE_TRANS)
+        # isdecimal()はint()が受け付ける数字（全角数字を含む）と一致
+        if not price_clean.isdecimal():
+            return None
+        price = int(price_clean)
+        if _MIN_VALID_PRICE <= price <= _MAX_VALID_PRICE:
+            return price
         return None
     
     @staticmethod
     def validate_name(name: str) -> Optional[str]:
-        name = re.sub(r"\s+", " ", name).strip()
-        return name if len(name) >= Constants.MIN_PRODUCT_NAME_LENGTH else None
+        name = _RE_WHITESPACE.sub(" ", name).strip()
+        return name if len(name) >= _MIN_PRODUCT_NAME_LENGTH else None
+
+class HttpCache:
+    """ETag/Last-Modifiedによる条件付きGET用キャッシュ（pathを指定した場合のみJSONファイルに永続化）"""
+    
+    def __init__(self, path: str = Constants.HTTP_CACHE_PATH, logger: Optional[LoggerProtocol] = None):
+        self._path = path
+        self._logger = logger or StructuredLogger()
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._entries: Dict[str, Dict[str, str]] = self._load()
+    
+    def _load(self) -> Dict[str, Dict[str, str]]:
+        if not self._path:
+            return {}
+        try:
+            with open(self._path, encoding="utf-8") as fp:
+                data = json.load(fp)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        with self._lock:
+            entry = self._entries.get(url)
+        headers: Dict[str, str] = {}
+        if entry and "body" in entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+    
+    def get_body(self, url: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(url)
+        return entry.get("body") if entry else None
+    
+    def store(self, url: str, etag: Optional[str], last_modified: Optional[str], body: str) -> None:
+        if not (etag or last_modified):
+            return
+        with self._lock:
+            self._entries[url] = {"etag": etag or "", "last_modified": last_modified or "", "body": body}
+            self._dirty = True
+    
+    def save(self) -> None:
+        with self._lock:
+            if not self._path or not self._dirty:
+                return
+            # 一時ファイル経由のアトミック書き込み（破損防止）
+            try:
+                directory = os.path.dirname(self._path) or "."
+                os.makedirs(directory, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8") as fp:
+                    json.dump(self._entries, fp, ensure_ascii=False)
+                os.replace(tmp_path, self._path)
+                self._dirty = False
+            except OSError as e:
+                self._logger.warning(f"HTTPキャッシュ保存失敗: {e}")
 
 class HttpClient:
-    def __init__(self, timeout: int = Constants.REQUEST_TIMEOUT_SECONDS, logger: Optional[LoggerProtocol] = None):
+    def __init__(self, timeout: int = Constants.REQUEST_TIMEOUT_SECONDS, logger: Optional[LoggerProtocol] = None,
+                 cache: Optional[HttpCache] = None):
         self._timeout = timeout
         self._logger = logger or StructuredLogger()
+        self._cache = cache or HttpCache(logger=self._logger)
         self._session = requests.Session()
+        # 並行取得時も同一ホストへの接続を使い回す（Keep-Alive）
+        adapter = HTTPAdapter(pool_connections=Constants.HTTP_POOL_CONNECTIONS,
+                              pool_maxsize=Constants.HTTP_POOL_MAXSIZE)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        # Accept-Encodingはrequestsの既定値を使用（brotli導入時はbrも自動で広告・展開される）
         self._session.headers.update({
             "User-Agent": Constants.USER_AGENT,
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "ja,en-US;q=0.9,en;q=0.8",
+            "Connection": "keep-alive",
         })
     
     def get_html(self, url: str) -> str:
         self._logger.debug(f"GET: {url}")
-        response = self._session.get(url, timeout=self._timeout)
+        response = self._session.get(url, timeout=self._timeout, headers=self._cache.conditional_headers(url))
+        if response.status_code == 304:
+            cached = self._cache.get_body(url)
+            if cached is not None:
+                self._logger.debug(f"304 Not Modified: {url}")
+                return cached
         response.raise_for_status()
         response.encoding = response.apparent_encoding or 'utf-8'
-        return response.text
+        html = response.text
+        self._cache.store(url, response.headers.get("ETag"), response.headers.get("Last-Modified"), html)
+        return html
     
     def close(self) -> None:
+        self._cache.save()
         self._session.close()
 
 class MediajoyParser:
     def __init__(self, validator: ProductValidator, logger: Optional[LoggerProtocol] = None):
         self._validator = validator
+        # 商品毎に呼ぶため束縛済みメソッドを保持
+        self._validate_price = validator.validate_price
+        self._validate_name = validator.validate_name
         self._logger = logger or StructuredLogger()
     
     def parse(self, html: str, url_index: int) -> List[ProductData]:
-        products: List[ProductData] = []
-        soup = BeautifulSoup(html, 'html.parser')
+        return list(self.iter_products(html, url_index))
+    
+    def iter_products(self, html: str, url_index: int) -> Iterator[ProductData]:
+        """商品を逐次生成（中間リストを経由しない）"""
+        if Constants.USE_SELECTOLAX:
+            yield from self._iter_selectolax(html, url_index)
+        else:
+            yield from self._iter_soup(html, url_index)
+    
+    @staticmethod
+    def _is_skip_section(title_text: str) -> bool:
+        return any(keyword in title_text for keyword in Constants.SKIP_SECTION_KEYWORDS)
+    
+    def _iter_selectolax(self, html: str, url_index: int) -> Iterator[ProductData]:
+        count = 0
+        tree = LexborHTMLParser(html)
+        
+        sections = tree.css('section.section-block')
+        self._logger.debug(f"URL index {url_index}: {len(sections)}個のセクション検出")
+        
+        for section in sections:
+            title_elem = section.css_first('h2.title')
+            if title_elem:
+                title_text = title_elem.text(strip=True)
+                if self._is_skip_section(title_text):
+                    self._logger.debug(f"おすすめセクションをスキップ: {title_text}")
+                    continue
+            
+            product_lists = section.css('ul.list-product li') or section.css('li')
+            for rank, item in enumerate(product_lists, start=count+1):
+                parsed = self._parse_text(item.text(), url_index, rank)
+                if parsed:
+                    count += 1
+                    yield parsed
+        
+        if not sections:
+            items = self._find_price_containers_selectolax(tree)
+            self._logger.debug(f"フォールバック: {len(items)}個の要素検出")
+            for rank, item in enumerate(items, start=1):
+                parsed = self._parse_text(item.text(), url_index, rank)
+                if parsed:
+                    yield parsed
+    
+    @staticmethod
+    def _find_price_containers_selectolax(tree: LexborHTMLParser) -> List[LexborNode]:
+        """_find_price_containersのselectolax版（価格テキストで絞り込んでから上限を適用）"""
+        containers: List[LexborNode] = []
+        if tree.root is None:
+            return containers
+        seen: set[int] = set()
+        # 要素を文書順に走査し、直下のテキストに価格を含む要素を起点とする
+        for node in tree.root.traverse():
+            if not _RE_PRICE.search(node.text(deep=False)):
+                continue
+            container: Optional[LexborNode] = node
+            while container is not None and container.tag not in Constants.FALLBACK_CONTAINER_TAGS:
+                container = container.parent
+            if container is None or container.mem_id in seen:
+                continue
+            seen.add(container.mem_id)
+            containers.append(container)
+            if len(containers) >= Constants.FALLBACK_MAX_ITEMS:
+                break
+        return containers
+    
+    def _iter_soup(self, html: str, url_index: int) -> Iterator[ProductData]:
+        count = 0
+        soup = BeautifulSoup(html, Constants.HTML_PARSER)
         
         # section-block全体を取得
         sections = soup.select('section.section-block')
@@ -267,7 +504,7 @@ class MediajoyParser:
             if title_elem:
                 title_text = title_elem.get_text(strip=True)
                 # 「おすすめ」セクションはスキップ
-                if 'おすすめ' in title_text or '人気' in title_text or 'ランキング' in title_text:
+                if self._is_skip_section(title_text):
                     self._logger.debug(f"おすすめセクションをスキップ: {title_text}")
                     continue
             
@@ -277,45 +514,58 @@ class MediajoyParser:
                 # フォールバック：セクション内の全li要素
                 product_lists = section.select('li')
             
-            for rank, item in enumerate(product_lists, start=len(products)+1):
+            for rank, item in enumerate(product_lists, start=count+1):
                 parsed = self._parse_item(item, url_index, rank)
                 if parsed:
-                    products.append(parsed)
+                    count += 1
+                    yield parsed
         
-        # セクションがない場合のフォールバック
+        # セクションがない場合のフォールバック（価格テキストを含む要素のみ対象）
         if not sections:
-            items = soup.select('.item, .product, li, tr')
+            items = self._find_price_containers(soup)
             self._logger.debug(f"フォールバック: {len(items)}個の要素検出")
             for rank, item in enumerate(items, start=1):
                 parsed = self._parse_item(item, url_index, rank)
                 if parsed:
-                    products.append(parsed)
-        
-        return products
+                    yield parsed
+    
+    @staticmethod
+    def _find_price_containers(soup: BeautifulSoup) -> List[Any]:
+        """価格文字列を起点に最寄りのブロック要素を収集（全li/trの走査を回避）"""
+        containers: List[Any] = []
+        seen: set[int] = set()
+        for price_node in soup.find_all(string=_RE_PRICE):
+            container = price_node.find_parent(Constants.FALLBACK_CONTAINER_TAGS)
+            if container is None or id(container) in seen:
+                continue
+            seen.add(id(container))
+            containers.append(container)
+            if len(containers) >= Constants.FALLBACK_MAX_ITEMS:
+                break
+        return containers
     
     def _parse_item(self, item, url_index: int, rank: int) -> Optional[ProductData]:
+        # 価格を含まない要素は全文テキスト生成前に除外
+        if item.find(string=_RE_YEN) is None:
+            return None
+        return self._parse_text(item.get_text(), url_index, rank)
+    
+    def _parse_text(self, text: str, url_index: int, rank: int) -> Optional[ProductData]:
         try:
-            text = item.get_text()
+            item_match = _RE_ITEM.match(text)
+            if not item_match:
+                return None
             
             # 数字で始まる行（おすすめ商品）をスキップ
             # 例: "1 リンホフ スーパーテヒニカ4×5 105000円"
-            text_stripped = text.strip()
-            if re.match(r'^\d+\s+', text_stripped):
+            if item_match.group('lead'):
                 return None
             
-            price_match = re.search(r'([\d,]+)\s*円', text)
-            if not price_match:
-                return None
-            price = self._validator.validate_price(price_match.group(1))
+            price = self._validate_price(item_match.group('price'))
             if price is None:
                 return None
-            name_part = text[:price_match.start()].strip()
-            
-            # 商品名も数字で始まる場合を除外（念のため）
-            if re.match(r'^\d+\s+', name_part):
-                return None
             
-            name = self._validator.validate_name(name_part)
+            name = self._validate_name(item_match.group('name'))
             if not name:
                 return None
             return ProductData.create(name=name, price=price, url_index=url_index, rank=rank)
@@ -336,6 +586,17 @@ class MediajoyScraper:
         self._http_client = HttpClient(logger=self._logger)
     
     def scrape(self) -> ScrapeResult:
+        """同期ラッパー（後方互換性）。イベントループ実行中に呼ばれた場合は別スレッドで実行する"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.scrape_async())
+        # 実行中のループ内ではasyncio.runを使えないため、専用スレッドで新しいループを回す
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self.scrape_async()).result()
+    
+    async def scrape_async(self) -> ScrapeResult:
+        """全URLを並行取得（HTTP取得・パースはスレッドへ退避）"""
         correlation_id = str(uuid.uuid4())[:8]
         self._logger.set_correlation_id(correlation_id)
         start_time = time.time()
@@ -348,16 +609,24 @@ class MediajoyScraper:
                                   duration_seconds=time.time() - start_time, exit_code=ScraperExitCode.CIRCUIT_OPEN,
                                   correlation_id=correlation_id)
             
-            for url_index, url in enumerate(self._target_urls):
-                print(f"---URL_INDEX:{url_index}---")
-                try:
-                    products = self._scrape_single_url(url, url_index)
-                    all_products.extend(products)
-                    for product in products:
-                        print(product.to_output_line())
-                except Exception as e:
-                    self._logger.error(f"URL index {url_index} エラー: {e}")
+            results = await asyncio.gather(
+                *(self._scrape_single_url_async(url, url_index)
+                  for url_index, url in enumerate(self._target_urls)),
+                return_exceptions=True,
+            )
+            
+            # 出力はurl_index順を維持し、1回のwriteでまとめて出力
+            out_lines: List[str] = []
+            for url_index, result in enumerate(results):
+                out_lines.append(f"---URL_INDEX:{url_index}---")
+                if isinstance(result, BaseException):
+                    self._logger.error(f"URL index {url_index} エラー: {result}")
                     continue
+                for product in result:
+                    all_products.append(product)
+                    out_lines.append(product.to_output_line())
+            sys.stdout.write("\n".join(out_lines) + "\n")
+            sys.stdout.flush()
             
             duration = time.time() - start_time
             self._logger.info(f"スクレイピング完了: {len(all_products)}件取得 ({duration:.2f}秒)")
@@ -372,12 +641,12 @@ class MediajoyScraper:
         finally:
             self._http_client.close()
     
-    def _scrape_single_url(self, url: str, url_index: int) -> List[ProductData]:
-        def _scrape() -> List[ProductData]:
+    async def _scrape_single_url_async(self, url: str, url_index: int) -> List[ProductData]:
+        async def _scrape() -> List[ProductData]:
             with self._circuit_breaker.protect():
-                html = self._http_client.get_html(url)
-                return self._parser.parse(html, url_index)
-        return self._retry_policy.execute_with_retry(_scrape, f"scrape_url_{url_index}")
+                html = await asyncio.to_thread(self._http_client.get_html, url)
+                return await asyncio.to_thread(self._parser.parse, html, url_index)
+        return await self._retry_policy.execute_with_retry_async(_scrape, f"scrape_url_{url_index}")
 
 def main() -> int:
     logger = StructuredLogger(level=getattr(logging, os.environ.get("LOG_LEVEL", "INFO").upper(), logging.INFO))
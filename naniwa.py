@@ -39,6 +39,45 @@ ADR-002: URL構成
   url_index: 1 → e16042201_p2 (値下げページ2)
   url_index: 2 → ezaiko (新着ページ) ※従来通り
 
+ADR-003: 静的HTML優先取得・Playwrightはフォールバック
+=========================================
+- Status: ACCEPTED
+- Context: 商品一覧はサーバーサイドレンダリング済みで、Chromium起動と
+  STABILITY_WAIT_MS待機がURL毎に発生していた
+- Decision: まずHTTP GETで取得し、商品ブロック・価格マーカーがあり
+  1件以上パースできればそのまま採用。失敗時のみPlaywrightで取得
+  （ブラウザは必要になった時点で遅延起動、NANIWA_STATIC_FETCH=0で無効化）
+- Consequences: 通常時はブラウザ起動・固定待機を省略、JS描画が必要な場合も従来通り取得
+
+ADR-004: URL単位の並列実行
+=========================================
+- Status: ACCEPTED
+- Context: 3URLを単一ページで逐次処理しており、待機時間がURL数分積み上がる
+- Decision: playwright.async_api + asyncio.gather（hardoff.pyと同構成）。
+  コンテキストは1つを共有し、URL毎にページを作成（同時実行数はMAX_CONCURRENT_PAGES）。
+  静的取得はasyncio.to_threadで並行実行
+- Consequences: 所要時間は最も遅いURL程度に短縮、出力はurl_index順を維持
+
+ADR-005: ブラウザの常駐
+=========================================
+- Status: ACCEPTED
+- Context: scrape()毎にChromiumを起動・終了しており、起動コストが毎回発生
+- Decision: PlaywrightManagerがBrowserを保持し(start/stop)、実行毎にBrowserContextのみ作成。
+  同一イベントループでscrape_async()を繰り返し呼ぶ場合はブラウザを使い回し、aclose()で解放。
+  同期ラッパーscrape()は呼び出し毎にasyncio.runでループを作り、終了時にブラウザも停止する
+- Consequences: 2回目以降のブラウザ起動コストが不要になるのは、常駐プロセスが
+  1つのイベントループ上でscrape_async()を繰り返し呼ぶ場合のみ。
+  scrape()（master_controllerからの単発実行を含む）は従来通り毎回ブラウザを起動する
+
+ADR-006: selectolax（lexbor）による静的HTML解析
+=========================================
+- Status: ACCEPTED
+- Context: 静的HTML経路の解析時間の大半がBeautifulSoupのツリー構築
+- Decision: selectolax導入済みならLexborHTMLParserで解析し、EXTRACT_JSと同じ
+  行形式に変換してparse_rowsで検証（NANIWA_USE_SELECTOLAX=0で無効化）。
+  BeautifulSoup経路はフォールバックとして維持
+- Consequences: 解析はC実装で完結、出力はBeautifulSoup経路と同一
+
 【SLI/SLO定義】
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 - SLI: 値下げ検知成功率
@@ -47,11 +86,15 @@ ADR-002: URL構成
 【依存関係】
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 - playwright: ^1.40.0
-- beautifulsoup4: ^4.12.0
+- beautifulsoup4: ^4.12.0（soupsieveを含む）
+- requests: ^2.31.0
+- lxml: ^5.0.0（任意・未導入時はhtml.parser）
+- selectolax: ^0.3.17（任意・未導入時はBeautifulSoup）
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import logging
 import os
@@ -60,12 +103,15 @@ import re
 import sys
 import time
 import uuid
-from contextlib import contextmanager
+from contextlib import AsyncExitStack, asynccontextmanager, contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum, auto
+from functools import lru_cache
 from typing import (
     Any,
+    AsyncGenerator,
+    Awaitable,
     Callable,
     Dict,
     Final,
@@ -78,13 +124,25 @@ from typing import (
     TypeVar,
 )
 
-from bs4 import BeautifulSoup, Tag
-from playwright.sync_api import (
+import requests
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+try:
+    import lxml  # noqa: F401  BeautifulSoupのCパーサーとして使用
+    _HAS_LXML = True
+except ImportError:
+    _HAS_LXML = False
+try:
+    from selectolax.lexbor import LexborHTMLParser, LexborNode
+    _HAS_SELECTOLAX = True
+except ImportError:
+    _HAS_SELECTOLAX = False
+from playwright.async_api import (
     Browser,
     BrowserContext,
-    Page,
     Playwright,
-    sync_playwright,
+    Route,
+    async_playwright,
     TimeoutError as PlaywrightTimeoutError,
 )
 
@@ -128,7 +186,26 @@ class Constants:
     # Playwright
     PAGE_LOAD_TIMEOUT_MS: Final[int] = 60000
     ELEMENT_TIMEOUT_MS: Final[int] = 10000
-    STABILITY_WAIT_MS: Final[int] = 3000
+    # 固定待機ではなく商品ブロックの出現数で描画完了を判定
+    ITEMS_READY_MIN_COUNT: Final[int] = 5
+    ITEMS_READY_TIMEOUT_MS: Final[int] = 3000
+    ITEMS_READY_JS: Final[str] = "([sel, min]) => document.querySelectorAll(sel).length > min"
+    MAX_CONCURRENT_PAGES: Final[int] = 3
+    # テキスト抽出に不要なリソースは取得しない
+    BLOCKED_RESOURCE_TYPES: Final[frozenset[str]] = frozenset(
+        {"image", "font", "stylesheet", "media", "websocket"}
+    )
+    
+    # 静的HTML取得（Playwright不要なページはHTTP GETのみで処理）
+    STATIC_FETCH_ENABLED: Final[bool] = os.environ.get("NANIWA_STATIC_FETCH", "1") != "0"
+    STATIC_FETCH_TIMEOUT_SECONDS: Final[int] = 30
+    USER_AGENT: Final[str] = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36"
+    )
+    
+    # HTMLパーサー（lxml未導入時はhtml.parserにフォールバック）
+    HTML_PARSER: Final[str] = "lxml" if _HAS_LXML else "html.parser"
+    USE_SELECTOLAX: Final[bool] = _HAS_SELECTOLAX and os.environ.get("NANIWA_USE_SELECTOLAX", "1") != "0"
     
     # バリデーション
     MIN_VALID_PRICE: Final[int] = 100
@@ -178,6 +255,14 @@ class PriceType(Enum):
 # データクラス
 # ============================================================================
 
+@lru_cache(maxsize=2048)
+def _format_price_pair(current_price: int, original_price: Optional[int]) -> str:
+    """価格文字列の生成結果を(現在価格, 元値)単位でキャッシュ"""
+    if original_price:
+        return f"¥{format(original_price, ',d')} → ¥{format(current_price, ',d')}"
+    return f"¥{format(current_price, ',d')}"
+
+
 @dataclass(frozen=True, slots=True)
 class PriceInfo:
     """価格情報"""
@@ -187,9 +272,9 @@ class PriceInfo:
     
     def to_price_string(self) -> str:
         """価格文字列を生成"""
-        if self.price_type == PriceType.SALE and self.original_price:
-            return f"¥{self.original_price:,} → ¥{self.current_price:,}"
-        return f"¥{self.current_price:,}"
+        if self.price_type == PriceType.SALE:
+            return _format_price_pair(self.current_price, self.original_price)
+        return _format_price_pair(self.current_price, None)
     
     @property
     def monitoring_price(self) -> int:
@@ -213,9 +298,9 @@ class ProductData:
         page_type: str = "", rank: int = 0
     ) -> ProductData:
         # ハッシュは商品名+現在価格で生成
-        product_hash = hashlib.md5(
-            f"{name}_{price_info.current_price}".encode("utf-8")
-        ).hexdigest()[:8]
+        product_hash = hashlib.blake2b(
+            f"{name}_{price_info.current_price}".encode("utf-8"), digest_size=4
+        ).hexdigest()
         return cls(
             name=name, price_info=price_info, url_index=url_index,
             page_type=page_type, product_hash=product_hash, rank=rank
@@ -397,41 +482,65 @@ class RetryPolicy:
                 self._logger.warning(f"{operation_name}: 失敗 (attempt {attempt}/{self._max_attempts})")
                 
                 if attempt < self._max_attempts:
-                    delay = min(self._base_delay * (2 ** (attempt - 1)), self._max_delay)
-                    delay += random.uniform(-delay * 0.25, delay * 0.25)
-                    time.sleep(max(0.1, delay))
+                    time.sleep(self._calculate_delay(attempt))
         
         raise RetryExhaustedException(f"{operation_name}: リトライ失敗") from last_exception
+    
+    async def execute_with_retry_async(
+        self, operation: Callable[[], Awaitable[T]], operation_name: str = "operation"
+    ) -> T:
+        last_exception: Optional[Exception] = None
+        
+        for attempt in range(1, self._max_attempts + 1):
+            try:
+                return await operation()
+            except Exception as e:
+                last_exception = e
+                self._logger.warning(f"{operation_name}: 失敗 (attempt {attempt}/{self._max_attempts})")
+                
+                if attempt < self._max_attempts:
+                    await asyncio.sleep(self._calculate_delay(attempt))
+        
+        raise RetryExhaustedException(f"{operation_name}: リトライ失敗") from last_exception
+    
+    def _calculate_delay(self, attempt: int) -> float:
+        delay = min(self._base_delay * (2 ** (attempt - 1)), self._max_delay)
+        delay += random.uniform(-delay * 0.25, delay * 0.25)
+        return max(0.1, delay)
 
 
 # ============================================================================
 # バリデーター
 # ============================================================================
 
+_WS_RE: Final[re.Pattern[str]] = re.compile(r"\s+")
+# page_typeのページ番号部分（"値下げ2P" → "値下げ"）
+_PAGE_NUMBER_RE: Final[re.Pattern[str]] = re.compile(r"\d+P$")
+
+
 class ProductValidator:
-    # 価格抽出パターン
-    PRICE_PATTERNS: Tuple[str, ...] = (
+    # 価格抽出パターン（優先順位順: カンマ区切り → 数字のみ）
+    _PRICE_PATTERNS: Final[Tuple[re.Pattern[str], ...]] = tuple(re.compile(p) for p in (
         r"[￥¥]\s*(\d{1,3}(?:,\d{3})+)",
         r"[￥¥]\s*(\d+)",
-    )
+    ))
     
-    @classmethod
-    def extract_price(cls, price_text: str) -> Optional[int]:
-        """価格テキストから数値を抽出"""
-        for pattern in cls.PRICE_PATTERNS:
-            match = re.search(pattern, price_text)
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def extract_price(price_text: str) -> Optional[int]:
+        """価格テキストから数値を抽出（同一価格表記が多いため結果をキャッシュ）"""
+        for pattern in ProductValidator._PRICE_PATTERNS:
+            match = pattern.search(price_text)
             if match:
-                try:
-                    price = int(match.group(1).replace(",", ""))
-                    if Constants.MIN_VALID_PRICE <= price <= Constants.MAX_VALID_PRICE:
-                        return price
-                except ValueError:
-                    continue
+                # \dは全角数字にもマッチし、int()もそれを受け付ける
+                price = int(match.group(1).replace(",", ""))
+                if Constants.MIN_VALID_PRICE <= price <= Constants.MAX_VALID_PRICE:
+                    return price
         return None
     
     @staticmethod
     def validate_name(name: str) -> Optional[str]:
-        name = re.sub(r"\s+", " ", name).strip()
+        name = _WS_RE.sub(" ", name).strip()
         return name if len(name) >= Constants.MIN_PRODUCT_NAME_LENGTH else None
 
 
@@ -440,39 +549,119 @@ class ProductValidator:
 # ============================================================================
 
 class PlaywrightManager:
+    """Browserを常駐させ、スクレイプ毎にBrowserContextのみ新規作成する"""
+    
     def __init__(self, headless: bool = True, logger: Optional[LoggerProtocol] = None):
         self._headless = headless
         self._logger = logger or StructuredLogger()
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
     
-    @contextmanager
-    def browser_context(self) -> Generator[BrowserContext, None, None]:
-        playwright: Optional[Playwright] = None
-        browser: Optional[Browser] = None
-        context: Optional[BrowserContext] = None
-        
+    @property
+    def is_running(self) -> bool:
+        return self._browser is not None and self._browser.is_connected()
+    
+    async def start(self) -> None:
+        if self.is_running:
+            return
+        # 切断済みブラウザが残っていれば片付けてから再起動
+        await self.stop()
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(
+            headless=self._headless,
+            args=["--no-sandbox", "--disable-setuid-sandbox", "--disable-dev-shm-usage"],
+        )
+        self._logger.info("ブラウザ起動")
+    
+    async def stop(self) -> None:
+        if self._browser:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+        if self._playwright:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+    
+    async def __aenter__(self) -> PlaywrightManager:
+        await self.start()
+        return self
+    
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.stop()
+    
+    @asynccontextmanager
+    async def browser_context(self) -> AsyncGenerator[BrowserContext, None]:
+        await self.start()
+        assert self._browser is not None
+        context = await self._browser.new_context(
+            viewport={"width": 1920, "height": 1080},
+            user_agent=Constants.USER_AGENT,
+        )
         try:
-            playwright = sync_playwright().start()
-            browser = playwright.chromium.launch(
-                headless=self._headless,
-                args=["--no-sandbox", "--disable-setuid-sandbox", "--disable-dev-shm-usage"],
-            )
-            context = browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36",
-            )
+            await context.route("**/*", self._route_handler)
             yield context
         finally:
-            for resource in [context, browser]:
-                if resource:
-                    try:
-                        resource.close()
-                    except Exception:
-                        pass
-            if playwright:
-                try:
-                    playwright.stop()
-                except Exception:
-                    pass
+            try:
+                await context.close()
+            except Exception:
+                pass
+    
+    @staticmethod
+    async def _route_handler(route: Route) -> None:
+        if route.request.resource_type in Constants.BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+
+# ============================================================================
+# 静的HTML取得
+# ============================================================================
+
+class StaticHtmlFetcher:
+    """サーバーサイドレンダリング済みページをHTTP GETのみで取得"""
+    
+    # 商品ブロックと価格要素がHTMLに含まれていればJS描画は不要と判定
+    _PRODUCT_MARKER: Final[re.Pattern[str]] = re.compile(r"tile_item|Item_tile")
+    _PRICE_MARKER: Final[re.Pattern[str]] = re.compile(r"price_")
+    
+    def __init__(
+        self, timeout: int = Constants.STATIC_FETCH_TIMEOUT_SECONDS, logger: Optional[LoggerProtocol] = None
+    ):
+        self._timeout = timeout
+        self._logger = logger or StructuredLogger()
+        self._session = requests.Session()
+        self._session.headers.update({
+            "User-Agent": Constants.USER_AGENT,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "ja,en-US;q=0.9,en;q=0.8",
+        })
+    
+    def try_fetch(self, url: str) -> Optional[str]:
+        """静的HTMLを取得。商品マーカーが無い・通信失敗時はNone（Playwrightへフォールバック）"""
+        try:
+            response = self._session.get(url, timeout=self._timeout)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            self._logger.debug(f"静的取得失敗: {url} ({e})")
+            return None
+        
+        if "charset" not in response.headers.get("Content-Type", "").lower():
+            response.encoding = response.apparent_encoding or "utf-8"
+        html = response.text
+        
+        if not (self._PRODUCT_MARKER.search(html) and self._PRICE_MARKER.search(html)):
+            self._logger.debug(f"静的HTMLに商品マーカーなし: {url}")
+            return None
+        return html
+    
+    def close(self) -> None:
+        self._session.close()
 
 
 # ============================================================================
@@ -482,46 +671,212 @@ class PlaywrightManager:
 class NaniwaHtmlParser:
     """カメラのナニワHTML解析器（値下げ検知対応版）"""
     
+    # 商品ブロック候補のみをツリー化（head/script/ナビ等は構築しない）
+    _BLOCK_STRAINER: Final[SoupStrainer] = SoupStrainer(
+        class_=re.compile(r"tile_item|Item_tile|tile_elm")
+    )
+    
+    # 価格要素の有無の事前判定用（価格セレクタはいずれもclassに"price"を含む）
+    _PRICE_CLASS_RE: Final[re.Pattern[str]] = re.compile("price")
+    
+    # CSSセレクタはインポート時に1度だけコンパイル（優先順に試行）
+    _BLOCK_SELECTORS: Final[Tuple[sv.SoupSieve, ...]] = tuple(sv.compile(s) for s in (
+        Constants.PRODUCT_BLOCK_SELECTOR,
+        Constants.PRODUCT_BLOCK_SELECTOR_ALT,
+        ".StyleT_Item_tile_item_",
+        ".StyleIf_item_tile_item",
+        "div[class*='StyleT_Item_tile']",
+        "div[class*='tile_item']",
+        "div[class*='tile_elm']",
+    ))
+    _SEL_A_TITLE: Final[sv.SoupSieve] = sv.compile("a[title]")
+    # 商品名の代替セレクタは段階毎に1つへ結合し、ブロック走査を1回で済ませる
+    _SEL_NAME1: Final[sv.SoupSieve] = sv.compile(
+        f"{Constants.PRODUCT_NAME1_SELECTOR}, .name1_, div[class*='name1']"
+    )
+    _SEL_NAME: Final[sv.SoupSieve] = sv.compile(
+        f"{Constants.PRODUCT_NAME_SELECTOR}, .name_, div[class*='name']"
+    )
+    _PRICE_SALE_SELECTORS: Final[Tuple[sv.SoupSieve, ...]] = tuple(sv.compile(s) for s in (
+        Constants.PRICE_SALE_SELECTOR, ".price_sale_",
+    ))
+    _PRICE_BEFORE_SELECTORS: Final[Tuple[sv.SoupSieve, ...]] = tuple(sv.compile(s) for s in (
+        Constants.PRICE_BEFORE_SELECTOR, ".price_before_",
+    ))
+    _PRICE_NORMAL_SELECTORS: Final[Tuple[sv.SoupSieve, ...]] = tuple(sv.compile(s) for s in (
+        Constants.PRICE_NORMAL_SELECTOR,
+        Constants.PRICE_NORMAL_SELECTOR_ALT,
+        ".price_",
+        "div[class*='price']",
+    ))
+    
+    # ブラウザ内抽出（page.evaluate）用: 上記と同じセレクタ・優先順で要素テキストを収集し、
+    # HTML全体の転送とPython側のツリー構築を省く。テキストは get_text(strip=True) と同じく
+    # テキストノード毎にtrimして連結する
+    EXTRACT_JS: Final[str] = """
+    ({blocks, aTitle, name1, name, sale, before, normal}) => {
+        const text = (el) => {
+            if (!el) return null;
+            const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+            let s = "";
+            while (walker.nextNode()) s += walker.currentNode.nodeValue.trim();
+            return s;
+        };
+        const first = (root, selectors) => {
+            for (const sel of selectors) {
+                const el = root.querySelector(sel);
+                if (el) return el;
+            }
+            return null;
+        };
+        let items = [];
+        for (const sel of blocks) {
+            items = document.querySelectorAll(sel);
+            if (items.length) break;
+        }
+        return Array.from(items, (el) => {
+            const a = el.querySelector(aTitle);
+            const saleEl = first(el, sale);
+            return {
+                names: [a ? a.getAttribute("title") : null, text(first(el, name1)), text(first(el, name))],
+                priceSale: text(saleEl),
+                priceBefore: saleEl ? text(first(el, before)) : null,
+                priceNormal: saleEl ? null : text(first(el, normal)),
+            };
+        });
+    }
+    """
+    EXTRACT_SELECTORS: Final[Dict[str, Any]] = {
+        "blocks": [s.pattern for s in _BLOCK_SELECTORS],
+        "aTitle": _SEL_A_TITLE.pattern,
+        "name1": [_SEL_NAME1.pattern],
+        "name": [_SEL_NAME.pattern],
+        "sale": [s.pattern for s in _PRICE_SALE_SELECTORS],
+        "before": [s.pattern for s in _PRICE_BEFORE_SELECTORS],
+        "normal": [s.pattern for s in _PRICE_NORMAL_SELECTORS],
+    }
+    
     def __init__(self, validator: ProductValidator, logger: Optional[LoggerProtocol] = None):
         self._validator = validator
         self._logger = logger or StructuredLogger()
+        # 同一サイトの後続ページでは前回ヒットしたブロックセレクタから試行
+        self._last_block_selector: Optional[sv.SoupSieve] = None
     
     def parse(self, html: str, url_index: int, page_type: str) -> List[ProductData]:
-        soup = BeautifulSoup(html, "html.parser")
+        if Constants.USE_SELECTOLAX:
+            return self._parse_selectolax(html, url_index, page_type)
+        
         products: List[ProductData] = []
-        seen_hashes: Set[str] = set()
-        
-        # 商品ブロック取得（複数セレクタ試行）
-        blocks = []
-        selectors_to_try = [
-            Constants.PRODUCT_BLOCK_SELECTOR,
-            Constants.PRODUCT_BLOCK_SELECTOR_ALT,
-            ".StyleT_Item_tile_item_",
-            ".StyleIf_item_tile_item",
-            "div[class*='StyleT_Item_tile']",
-            "div[class*='tile_item']",
-            "div[class*='tile_elm']",
-        ]
-        
-        for selector in selectors_to_try:
-            blocks = soup.select(selector)
-            if blocks:
-                self._logger.debug(f"セレクタ '{selector}' で {len(blocks)}件検出")
-                break
+        seen: Set[Tuple[str, int]] = set()
+        
+        soup = BeautifulSoup(html, Constants.HTML_PARSER, parse_only=self._BLOCK_STRAINER)
+        blocks = self._select_blocks(soup)
+        if not blocks:
+            # サイト構造変更に備え、絞り込みなしで再パース
+            self._logger.debug(f"URL index {url_index}: 絞り込みパースで0件のため全体を再パース")
+            blocks = self._select_blocks(BeautifulSoup(html, Constants.HTML_PARSER))
         
         self._logger.info(f"URL index {url_index} ({page_type}): {len(blocks)}個の商品ブロック検出")
         
         for rank, block in enumerate(blocks, start=1):
-            product = self._parse_block(block, url_index, page_type, rank, seen_hashes)
+            product = self._parse_block(block, url_index, page_type, rank, seen)
             if product:
                 products.append(product)
         
         return products
     
+    def _parse_selectolax(self, html: str, url_index: int, page_type: str) -> List[ProductData]:
+        """selectolax（lexbor）で解析し、EXTRACT_JSと同じ行形式に変換"""
+        tree = LexborHTMLParser(html)
+        blocks: List[LexborNode] = []
+        for pattern in self.EXTRACT_SELECTORS["blocks"]:
+            blocks = tree.css(pattern)
+            if blocks:
+                break
+        return self.parse_rows([self._lexbor_row(block) for block in blocks], url_index, page_type)
+    
+    @classmethod
+    def _lexbor_row(cls, block: LexborNode) -> Dict[str, Any]:
+        selectors = cls.EXTRACT_SELECTORS
+        
+        def text(patterns: List[str]) -> Optional[str]:
+            for pattern in patterns:
+                node = block.css_first(pattern)
+                if node is not None:
+                    return node.text(strip=True)
+            return None
+        
+        a_tag = block.css_first(selectors["aTitle"])
+        sale_text = text(selectors["sale"])
+        return {
+            "names": [
+                a_tag.attributes.get("title") if a_tag is not None else None,
+                text(selectors["name1"]),
+                text(selectors["name"]),
+            ],
+            "priceSale": sale_text,
+            "priceBefore": text(selectors["before"]) if sale_text is not None else None,
+            "priceNormal": text(selectors["normal"]) if sale_text is None else None,
+        }
+    
+    def parse_rows(self, rows: List[Dict[str, Any]], url_index: int, page_type: str) -> List[ProductData]:
+        """EXTRACT_JSの戻り値から商品を生成（parseと同じ検証・重複排除）"""
+        products: List[ProductData] = []
+        seen: Set[Tuple[str, int]] = set()
+        
+        self._logger.info(f"URL index {url_index} ({page_type}): {len(rows)}個の商品ブロック検出")
+        
+        for rank, row in enumerate(rows, start=1):
+            name = next(
+                (v for v in map(self._validator.validate_name, filter(None, row["names"])) if v), None
+            )
+            if not name:
+                continue
+            
+            price_info = self._price_info_from_texts(row["priceSale"], row["priceBefore"], row["priceNormal"])
+            if price_info is None:
+                continue
+            
+            product = self._build_product(name, price_info, url_index, page_type, rank, seen)
+            if product:
+                products.append(product)
+        
+        return products
+    
+    def _select_blocks(self, soup: BeautifulSoup) -> List[Tag]:
+        """商品ブロック取得（複数セレクタ試行）"""
+        if self._last_block_selector is not None:
+            blocks = self._last_block_selector.select(soup)
+            if blocks:
+                return blocks
+        
+        for selector in self._BLOCK_SELECTORS:
+            if selector is self._last_block_selector:
+                continue
+            blocks = selector.select(soup)
+            if blocks:
+                self._logger.debug(f"セレクタ '{selector.pattern}' で {len(blocks)}件検出")
+                self._last_block_selector = selector
+                return blocks
+        return []
+    
+    @staticmethod
+    def _select_first(block: Tag, selectors: Tuple[sv.SoupSieve, ...]) -> Optional[Tag]:
+        """セレクタを優先順に試行し、最初に見つかった要素を返す"""
+        for selector in selectors:
+            elem = selector.select_one(block)
+            if elem is not None:
+                return elem
+        return None
+    
     def _parse_block(
-        self, block: Tag, url_index: int, page_type: str, rank: int, seen_hashes: Set[str]
+        self, block: Tag, url_index: int, page_type: str, rank: int, seen: Set[Tuple[str, int]]
     ) -> Optional[ProductData]:
         try:
+            # 価格要素のないブロック（広告・見出し等）は商品名抽出前に除外
+            if block.find(class_=self._PRICE_CLASS_RE) is None:
+                return None
+            
             # 商品名抽出
             name = self._extract_name(block)
             if not name:
@@ -532,22 +887,27 @@ class NaniwaHtmlParser:
             if price_info is None:
                 return None
             
-            # 重複チェック
-            product_hash = hashlib.md5(
-                f"{name}_{price_info.current_price}".encode("utf-8")
-            ).hexdigest()
-            if product_hash in seen_hashes:
-                return None
-            seen_hashes.add(product_hash)
-            
-            return ProductData.create(
-                name=name, price_info=price_info, url_index=url_index,
-                page_type=page_type, rank=rank
-            )
+            return self._build_product(name, price_info, url_index, page_type, rank, seen)
             
         except Exception:
             return None
     
+    @staticmethod
+    def _build_product(
+        name: str, price_info: PriceInfo, url_index: int, page_type: str, rank: int,
+        seen: Set[Tuple[str, int]]
+    ) -> Optional[ProductData]:
+        # 重複チェック（ページ内ローカル集合のためタプルで十分）
+        key = (name, price_info.current_price)
+        if key in seen:
+            return None
+        seen.add(key)
+        
+        return ProductData.create(
+            name=name, price_info=price_info, url_index=url_index,
+            page_type=page_type, rank=rank
+        )
+    
     def _extract_name(self, block: Tag) -> Optional[str]:
         """商品名を抽出
         
@@ -557,20 +917,16 @@ class NaniwaHtmlParser:
             <div class="name1_">その他 【中古】キエフ4+ジュピター8 50/2</div>
         </div>
         """
-        # 方法1: aタグのtitle属性（最も信頼性が高い）
-        a_tag = block.select_one("a[title]")
-        if a_tag and a_tag.get("title"):
-            name = a_tag.get("title", "").strip()
+        # 方法1: aタグのtitle属性（最も信頼性が高い、CSSを介さずfindで早期終了）
+        a_tag = block.find("a", title=True)
+        if a_tag and a_tag["title"]:
+            name = a_tag["title"].strip()
             validated = self._validator.validate_name(name)
             if validated:
                 return validated
         
         # 方法2: div.name1_（画像の構造に基づく）
-        name1_div = block.select_one(Constants.PRODUCT_NAME1_SELECTOR)
-        if not name1_div:
-            name1_div = block.select_one(".name1_")
-        if not name1_div:
-            name1_div = block.select_one("div[class*='name1']")
+        name1_div = self._SEL_NAME1.select_one(block)
         if name1_div:
             name = name1_div.get_text(strip=True)
             validated = self._validator.validate_name(name)
@@ -578,13 +934,7 @@ class NaniwaHtmlParser:
                 return validated
         
         # 方法3: div.name_（親要素）
-        name_div = block.select_one(Constants.PRODUCT_NAME_SELECTOR)
-        if not name_div:
-            name_div = block.select_one(".name_")
-        if not name_div:
-            name_div = block.select_one("div[class*='name_']")
-        if not name_div:
-            name_div = block.select_one("div[class*='name']")
+        name_div = self._SEL_NAME.select_one(block)
         if name_div:
             name = name_div.get_text(strip=True)
             validated = self._validator.validate_name(name)
@@ -606,62 +956,51 @@ class NaniwaHtmlParser:
         → PriceInfo(NORMAL, current=14800, original=None)
         """
         # まずセール価格をチェック（複数セレクタ試行）
-        sale_elem = block.select_one(Constants.PRICE_SALE_SELECTOR)
-        if not sale_elem:
-            sale_elem = block.select_one(".price_sale_")
+        sale_elem = self._select_first(block, self._PRICE_SALE_SELECTORS)
         
         if sale_elem:
-            # セール価格あり
-            sale_text = sale_elem.get_text(strip=True)
+            # セール価格あり → 元値を取得
+            before_elem = self._select_first(block, self._PRICE_BEFORE_SELECTORS)
+            return self._price_info_from_texts(
+                sale_elem.get_text(strip=True),
+                before_elem.get_text(strip=True) if before_elem else None,
+                None,
+            )
+        
+        # 通常価格のみ - 複数セレクタ試行
+        price_elem = self._select_first(block, self._PRICE_NORMAL_SELECTORS)
+        if not price_elem:
+            return None
+        return self._price_info_from_texts(None, None, price_elem.get_text(strip=True))
+    
+    def _price_info_from_texts(
+        self, sale_text: Optional[str], before_text: Optional[str], normal_text: Optional[str]
+    ) -> Optional[PriceInfo]:
+        """価格要素のテキストからPriceInfoを生成（セール価格があればそちらを優先）"""
+        if sale_text is not None:
             sale_price = self._validator.extract_price(sale_text)
-            
             if sale_price is None:
                 return None
             
-            # 元値を取得
-            before_elem = block.select_one(Constants.PRICE_BEFORE_SELECTOR)
-            if not before_elem:
-                before_elem = block.select_one(".price_before_")
-            
-            original_price = None
-            if before_elem:
-                before_text = before_elem.get_text(strip=True)
-                original_price = self._validator.extract_price(before_text)
-            
+            original_price = self._validator.extract_price(before_text) if before_text else None
             return PriceInfo(
                 price_type=PriceType.SALE,
                 current_price=sale_price,
                 original_price=original_price
             )
         
-        else:
-            # 通常価格のみ - 複数セレクタ試行
-            price_elem = None
-            for selector in [
-                Constants.PRICE_NORMAL_SELECTOR,
-                Constants.PRICE_NORMAL_SELECTOR_ALT,
-                ".price_",
-                "div[class*='price_']",
-                "div[class*='price']",
-            ]:
-                price_elem = block.select_one(selector)
-                if price_elem:
-                    break
-            
-            if not price_elem:
-                return None
-            
-            price_text = price_elem.get_text(strip=True)
-            current_price = self._validator.extract_price(price_text)
-            
-            if current_price is None:
-                return None
-            
-            return PriceInfo(
-                price_type=PriceType.NORMAL,
-                current_price=current_price,
-                original_price=None
-            )
+        if normal_text is None:
+            return None
+        
+        current_price = self._validator.extract_price(normal_text)
+        if current_price is None:
+            return None
+        
+        return PriceInfo(
+            price_type=PriceType.NORMAL,
+            current_price=current_price,
+            original_price=None
+        )
 
 
 # ============================================================================
@@ -685,14 +1024,35 @@ class NaniwaScraper:
         self._validator = ProductValidator()
         self._parser = NaniwaHtmlParser(self._validator, self._logger)
         self._playwright_manager = PlaywrightManager(logger=self._logger)
+        self._static_fetcher = StaticHtmlFetcher(logger=self._logger)
     
     def scrape(self) -> ScrapeResult:
+        """同期ラッパー（後方互換性）
+        
+        呼び出し毎にイベントループとブラウザを起動・終了するため、ブラウザの使い回しは行わない。
+        常駐させる場合は同一ループ上でscrape_async()を繰り返し呼び、最後にaclose()を呼ぶ（ADR-005）
+        """
+        async def _run() -> ScrapeResult:
+            try:
+                return await self.scrape_async()
+            finally:
+                await self.aclose()
+        
+        return asyncio.run(_run())
+    
+    async def aclose(self) -> None:
+        """常駐ブラウザとHTTPセッションを解放"""
+        await self._playwright_manager.stop()
+        self._static_fetcher.close()
+    
+    async def scrape_async(self) -> ScrapeResult:
+        """非同期スクレイピング実行（URL単位で並列）。ブラウザはaclose()まで保持する"""
         correlation_id = str(uuid.uuid4())[:8]
         self._logger.set_correlation_id(correlation_id)
         start_time = time.time()
         all_products: List[ProductData] = []
         
-        self._logger.info(f"スクレイピング開始: {len(self._target_urls)} URLs")
+        self._logger.info(f"スクレイピング開始: {len(self._target_urls)} URLs（並列実行）")
         
         try:
             if not self._circuit_breaker.can_execute():
@@ -702,34 +1062,65 @@ class NaniwaScraper:
                     correlation_id=correlation_id,
                 )
             
-            with self._playwright_manager.browser_context() as context:
-                page = context.new_page()
+            # ブラウザは静的取得で賄えないURLが出た時点で初めて起動し、全ワーカーで共有
+            async with AsyncExitStack() as stack:
+                contexts: List[BrowserContext] = []
+                context_lock = asyncio.Lock()
                 
-                for url_index, (page_type, url) in enumerate(self._target_urls):
-                    # URL Index出力
-                    print(f"---URL_INDEX:{url_index}---")
-                    
-                    try:
-                        products = self._scrape_single_url(page, url, url_index, page_type)
-                        all_products.extend(products)
-                        
-                        # 商品出力
-                        for product in products:
-                            print(product.to_output_line())
-                        
-                        self._logger.info(f"URL index {url_index} ({page_type}): {len(products)}件取得")
-                        
-                        # 値下げページの場合、価格タイプ統計をログ出力
-                        if "値下げ" in page_type:
-                            sale_count = sum(1 for p in products if p.price_info.price_type == PriceType.SALE)
-                            normal_count = len(products) - sale_count
-                            self._logger.info(f"  └ セール価格: {sale_count}件, 通常価格: {normal_count}件")
-                        
-                    except Exception as e:
-                        self._logger.error(f"URL index {url_index} ({page_type}) エラー: {e}")
-                        continue
+                async def get_context() -> BrowserContext:
+                    async with context_lock:
+                        if not contexts:
+                            contexts.append(
+                                await stack.enter_async_context(self._playwright_manager.browser_context())
+                            )
+                    return contexts[0]
                 
-                page.close()
+                semaphore = asyncio.Semaphore(Constants.MAX_CONCURRENT_PAGES)
+                results = await asyncio.gather(
+                    *(
+                        self._scrape_with_semaphore(semaphore, get_context, url, url_index, page_type)
+                        for url_index, (page_type, url) in enumerate(self._target_urls)
+                    ),
+                    return_exceptions=True,
+                )
+            
+            # 同一一覧のページ送り間（値下げ1P/2P）の重複を除外。
+            # 新着など別一覧は独立して監視されるため対象外
+            seen_by_listing: Dict[str, Set[Tuple[str, int]]] = {}
+            
+            # 結果出力（url_index順を維持）
+            for url_index, result in enumerate(results):
+                page_type = self._target_urls[url_index][0]
+                print(f"---URL_INDEX:{url_index}---")
+                
+                if isinstance(result, BaseException):
+                    self._logger.error(f"URL index {url_index} ({page_type}) エラー: {result}")
+                    continue
+                
+                seen = seen_by_listing.setdefault(_PAGE_NUMBER_RE.sub("", page_type), set())
+                unique: List[ProductData] = []
+                for product in result:
+                    key = (product.name, product.price_info.current_price)
+                    if key not in seen:
+                        seen.add(key)
+                        unique.append(product)
+                if len(unique) < len(result):
+                    self._logger.debug(f"URL index {url_index}: 前ページとの重複 {len(result) - len(unique)}件を除外")
+                result = unique
+                
+                all_products.extend(result)
+                # 商品行はURL単位で一括書き出し
+                sys.stdout.write("".join(f"{p.to_output_line()}\n" for p in result))
+                
+                self._logger.info(f"URL index {url_index} ({page_type}): {len(result)}件取得")
+                
+                # 値下げページの場合、価格タイプ統計をログ出力
+                if "値下げ" in page_type:
+                    sale_count = 0
+                    for p in result:
+                        sale_count += p.price_info.price_type is PriceType.SALE
+                    normal_count = len(result) - sale_count
+                    self._logger.info(f"  └ セール価格: {sale_count}件, 通常価格: {normal_count}件")
             
             duration = time.time() - start_time
             self._logger.info(f"スクレイピング完了: {len(all_products)}件取得 ({duration:.2f}秒)")
@@ -748,25 +1139,67 @@ class NaniwaScraper:
                 correlation_id=correlation_id,
             )
     
-    def _scrape_single_url(self, page: Page, url: str, url_index: int, page_type: str) -> List[ProductData]:
-        def _scrape() -> List[ProductData]:
+    async def _scrape_with_semaphore(
+        self,
+        semaphore: asyncio.Semaphore,
+        get_context: Callable[[], Awaitable[BrowserContext]],
+        url: str,
+        url_index: int,
+        page_type: str,
+    ) -> List[ProductData]:
+        """セマフォで並列数制限してスクレイピング"""
+        async with semaphore:
+            return await self._scrape_single_url_async(get_context, url, url_index, page_type)
+    
+    async def _scrape_single_url_async(
+        self,
+        get_context: Callable[[], Awaitable[BrowserContext]],
+        url: str,
+        url_index: int,
+        page_type: str,
+    ) -> List[ProductData]:
+        async def _scrape() -> List[ProductData]:
             with self._circuit_breaker.protect():
-                page.goto(url, timeout=Constants.PAGE_LOAD_TIMEOUT_MS, wait_until="load")
-                page.wait_for_timeout(Constants.STABILITY_WAIT_MS)
+                if Constants.STATIC_FETCH_ENABLED:
+                    html = await asyncio.to_thread(self._static_fetcher.try_fetch, url)
+                    if html is not None:
+                        products = self._parser.parse(html, url_index, page_type)
+                        if products:
+                            self._logger.debug(f"URL index {url_index}: 静的HTMLで取得")
+                            return products
+                        self._logger.info(f"URL index {url_index}: 静的HTMLで0件のためPlaywrightで再取得")
                 
+                # URL毎にページを作成（コンテキストは共有）
+                context = await get_context()
+                page = await context.new_page()
                 try:
-                    page.wait_for_selector(
-                        f"{Constants.PRODUCT_BLOCK_SELECTOR}, {Constants.PRODUCT_BLOCK_SELECTOR_ALT}",
-                        timeout=Constants.ELEMENT_TIMEOUT_MS
-                    )
-                except PlaywrightTimeoutError:
-                    self._logger.warning(f"URL index {url_index}: セレクタ待機タイムアウト（代替処理）")
-                
-                page.wait_for_timeout(1000)
-                html = page.content()
-                return self._parser.parse(html, url_index, page_type)
+                    await page.goto(url, timeout=Constants.PAGE_LOAD_TIMEOUT_MS, wait_until="domcontentloaded")
+                    
+                    block_selector = f"{Constants.PRODUCT_BLOCK_SELECTOR}, {Constants.PRODUCT_BLOCK_SELECTOR_ALT}"
+                    try:
+                        await page.wait_for_selector(
+                            block_selector, state="attached", timeout=Constants.ELEMENT_TIMEOUT_MS
+                        )
+                    except PlaywrightTimeoutError:
+                        self._logger.warning(f"URL index {url_index}: セレクタ待機タイムアウト（代替処理）")
+                    else:
+                        try:
+                            await page.wait_for_function(
+                                Constants.ITEMS_READY_JS,
+                                arg=[block_selector, Constants.ITEMS_READY_MIN_COUNT],
+                                timeout=Constants.ITEMS_READY_TIMEOUT_MS,
+                            )
+                        except PlaywrightTimeoutError:
+                            # 商品数が少ないページでは正常
+                            self._logger.debug(f"URL index {url_index}: 商品数待機タイムアウト")
+                    
+                    # DOMから必要なテキストのみをブラウザ内で抽出
+                    rows = await page.evaluate(NaniwaHtmlParser.EXTRACT_JS, NaniwaHtmlParser.EXTRACT_SELECTORS)
+                finally:
+                    await page.close()
+                return self._parser.parse_rows(rows, url_index, page_type)
         
-        return self._retry_policy.execute_with_retry(_scrape, f"scrape_{page_type}")
+        return await self._retry_policy.execute_with_retry_async(_scrape, f"scrape_{page_type}")
 
 
 # ============================================================================
@@ -9,9 +9,13 @@ nisshindo.py - 日進堂カメラ Playwright版
 from playwright.sync_api import sync_playwright
 from bs4 import BeautifulSoup
 import re
+import sys
 from datetime import datetime
 import time
 
+# 価格抽出："10,000円(税込)" → "10,000"
+PRICE_PATTERN = re.compile(r'([\d,]+)円')
+
 def scrape_nisshindo():
     """日進堂カメラ スクレイピング（Playwright版・4URL対応）"""
     
@@ -69,6 +73,7 @@ def scrape_nisshindo():
                     product_items = soup.find_all('li', class_='prd-lst-unit')
                     
                     page_count = 0
+                    output_lines = []
                     
                     for item in product_items:
                         try:
@@ -96,14 +101,14 @@ def scrape_nisshindo():
                             price_text = price_elem.get_text(strip=True)
                             
                             # 価格抽出："10,000円(税込)" → "10000"
-                            price_match = re.search(r'([\d,]+)円', price_text)
+                            price_match = PRICE_PATTERN.search(price_text)
                             if not price_match:
                                 continue
                             
                             price = price_match.group(1).replace(',', '')
                             
-                            # 出力（master_controller_v29が解析）
-                            print(f"{product_name} {price}円")
+                            # 出力（master_controller_v29が解析）※URL単位でまとめて書き出し
+                            output_lines.append(f"{product_name} {price}円\n")
                             
                             all_products.append({
                                 'name': product_name,
@@ -116,6 +121,7 @@ def scrape_nisshindo():
                         except Exception as e:
                             continue
                     
+                    sys.stdout.write("".join(output_lines))
                     print(f"  {page_count}件取得")
                     
                 except Exception as e:
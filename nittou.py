@@ -13,6 +13,7 @@ nittou.py - 日東商事スクレイピング（修正版）
 - 🟢 セッション再利用
 """
 
+import sys
 import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
@@ -24,6 +25,7 @@ MAX_PAGES = 50
 TIMEOUT_SECONDS = 10
 RETRY_COUNT = 3
 RETRY_DELAY = 2
+PRICE_STRIP_TABLE = str.maketrans('', '', '¥,')
 
 def scrape_nittou() -> List[Dict[str, str]]:
     """日東商事スクレイピング
@@ -96,7 +98,7 @@ def scrape_nittou() -> List[Dict[str, str]]:
                         continue
                     
                     name = name_tag.get_text(strip=True)
-                    price = price_tag.get_text(strip=True).replace('¥', '').replace(',', '').strip()
+                    price = price_tag.get_text(strip=True).translate(PRICE_STRIP_TABLE).strip()
                     
                     # 重複チェック
                     key = f"{name.lower()}_{price}"
@@ -129,5 +131,4 @@ if __name__ == "__main__":
     items = scrape_nittou()
     
     # master_controller用の標準出力
-    for item in items:
-        print(f"{item['name']} {item['price']}円")
\ No newline at end of file
+    sys.stdout.write("".join(f"{item['name']} {item['price']}円\n" for item in items))
\ No newline at end of file
@@ -39,28 +39,38 @@ ADR-002: セレクタベースの堅牢な解析
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 - requests: ^2.31.0
 - beautifulsoup4: ^4.12.0
+- lxml: ^5.0.0（任意・未導入時はhtml.parser）
 """
 
 from __future__ import annotations
 
+import array
+import asyncio
 import hashlib
+import itertools
 import logging
 import os
 import random
 import re
+import statistics
 import sys
+import threading
 import time
-import uuid
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import Enum, auto
+from functools import lru_cache
 from typing import (
     Any,
+    Awaitable,
     Callable,
     Dict,
     Final,
+    FrozenSet,
     Generator,
     Generic,
     Iterator,
@@ -76,7 +86,13 @@ from typing import (
 )
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup, Tag
+try:
+    import lxml  # noqa: F401  BeautifulSoupのCパーサーとして使用
+    _HAS_LXML = True
+except ImportError:
+    _HAS_LXML = False
 
 # ============================================================================
 # 型定義・Protocol
@@ -130,6 +146,15 @@ class Constants:
     
     # HTTP設定
     REQUEST_TIMEOUT_SECONDS: Final[int] = 15
+    HTTP_POOL_CONNECTIONS: Final[int] = 10
+    HTTP_POOL_MAXSIZE: Final[int] = 10
+    
+    # HTMLパーサー（lxml未導入時はhtml.parserにフォールバック）
+    HTML_PARSER: Final[str] = "lxml" if _HAS_LXML else "html.parser"
+    
+    # 価格探索する祖先要素の階層数（商品カード内で完結させる。
+    # それより外側は複数商品を含み、末尾マッチが別商品の価格になり得る）
+    PRICE_SEARCH_MAX_DEPTH: Final[int] = 3
     
     # 価格バリデーション
     MIN_VALID_PRICE: Final[int] = 100
@@ -139,6 +164,9 @@ class Constants:
     MIN_PRODUCT_NAME_LENGTH: Final[int] = 3
     MAX_PRODUCT_NAME_LENGTH: Final[int] = 500
     
+    # 取得上限（okoku.pyと同じ）
+    MAX_PRODUCTS: Final[int] = 100
+    
     # User Agent
     USER_AGENT: Final[str] = (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -171,6 +199,11 @@ class ScraperExitCode(Enum):
 # データクラス
 # ============================================================================
 
+def _new_correlation_id() -> str:
+    """ログ突合用の短いID（暗号強度は不要なためMTで生成、システムコールなし）"""
+    return random.randbytes(4).hex()
+
+
 @dataclass(frozen=True, slots=True)
 class ProductData:
     """商品データ（イミュータブル）"""
@@ -192,7 +225,7 @@ class ProductData:
         rank: int = 0,
     ) -> ProductData:
         """ファクトリメソッド"""
-        product_hash = hashlib.md5(f"{name}_{price}".encode("utf-8")).hexdigest()[:8]
+        product_hash = hashlib.blake2b(f"{name}_{price}".encode("utf-8"), digest_size=4).hexdigest()
         return cls(
             name=name,
             price=price,
@@ -208,16 +241,16 @@ class ProductData:
         return f"{self.name} {self.price}円"
 
 
-@dataclass
+@dataclass(slots=True)
 class CircuitBreakerState:
     """Circuit Breaker状態管理"""
     state: CircuitState = CircuitState.CLOSED
     failure_count: int = 0
-    last_failure_time: Optional[datetime] = None
+    last_failure_monotonic: float = 0.0  # time.monotonic()、0.0は未失敗
     half_open_call_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapeResult:
     """スクレイピング結果"""
     success: bool
@@ -225,7 +258,7 @@ class ScrapeResult:
     error_message: Optional[str] = None
     duration_seconds: float = 0.0
     exit_code: ScraperExitCode = ScraperExitCode.SUCCESS
-    correlation_id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    correlation_id: str = field(default_factory=_new_correlation_id)
 
 
 # ============================================================================
@@ -236,7 +269,7 @@ class ScraperException(Exception):
     """スクレイパー基底例外"""
     
     def __init__(self, message: str, correlation_id: Optional[str] = None):
-        self.correlation_id = correlation_id or str(uuid.uuid4())[:8]
+        self.correlation_id = correlation_id or _new_correlation_id()
         super().__init__(f"[{self.correlation_id}] {message}")
 
 
@@ -285,30 +318,47 @@ class StructuredLogger:
             return f"[{self._correlation_id}] {msg}"
         return msg
     
+    # 無効なレベルではメッセージ整形自体を行わない
     def debug(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        self._logger.debug(self._format_message(msg), *args, **kwargs)
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(self._format_message(msg), *args, **kwargs)
     
     def info(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        self._logger.info(self._format_message(msg), *args, **kwargs)
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(self._format_message(msg), *args, **kwargs)
     
     def warning(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        self._logger.warning(self._format_message(msg), *args, **kwargs)
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._logger.warning(self._format_message(msg), *args, **kwargs)
     
     def error(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        self._logger.error(self._format_message(msg), *args, **kwargs)
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._logger.error(self._format_message(msg), *args, **kwargs)
 
 
 # ============================================================================
 # インフラストラクチャ層: メトリクス
 # ============================================================================
 
+@lru_cache(maxsize=1024)
+def _metric_key(metric_name: str, tags_key: Optional[FrozenSet[Tuple[str, str]]]) -> str:
+    """メトリクスキー生成（同一名・タグの組はキャッシュ、キーはintern済み）"""
+    if tags_key:
+        tag_str = ",".join(f'{k}="{v}"' for k, v in sorted(tags_key))
+        return sys.intern(f"{metric_name}{{{tag_str}}}")
+    return sys.intern(metric_name)
+
+
 class InMemoryMetricsCollector:
-    """インメモリメトリクス収集"""
+    """インメモリメトリクス収集
+    
+    スクレイパーは単一スレッドから書き込む前提（ロックなし）
+    """
     
     def __init__(self) -> None:
-        self._counters: Dict[str, int] = {}
+        self._counters: defaultdict[str, int] = defaultdict(int)
         self._gauges: Dict[str, float] = {}
-        self._histograms: Dict[str, List[float]] = {}
+        self._histograms: defaultdict[str, array.array[float]] = defaultdict(lambda: array.array("d"))
     
     def increment(
         self,
@@ -316,8 +366,7 @@ class InMemoryMetricsCollector:
         value: int = 1,
         tags: Optional[Dict[str, str]] = None,
     ) -> None:
-        key = self._make_key(metric_name, tags)
-        self._counters[key] = self._counters.get(key, 0) + value
+        self._counters[self._make_key(metric_name, tags)] += value
     
     def gauge(
         self,
@@ -334,24 +383,18 @@ class InMemoryMetricsCollector:
         value: float,
         tags: Optional[Dict[str, str]] = None,
     ) -> None:
-        key = self._make_key(metric_name, tags)
-        if key not in self._histograms:
-            self._histograms[key] = []
-        self._histograms[key].append(value)
+        self._histograms[self._make_key(metric_name, tags)].append(value)
     
     @staticmethod
     def _make_key(metric_name: str, tags: Optional[Dict[str, str]]) -> str:
-        if tags:
-            tag_str = ",".join(f'{k}="{v}"' for k, v in sorted(tags.items()))
-            return f"{metric_name}{{{tag_str}}}"
-        return metric_name
+        return _metric_key(metric_name, frozenset(tags.items()) if tags else None)
     
     def get_metrics(self) -> Dict[str, Any]:
         return {
             "counters": dict(self._counters),
             "gauges": dict(self._gauges),
             "histograms": {
-                k: {"count": len(v), "sum": sum(v), "avg": sum(v) / len(v) if v else 0}
+                k: {"count": len(v), "sum": sum(v), "avg": statistics.fmean(v) if v else 0}
                 for k, v in self._histograms.items()
             },
         }
@@ -373,25 +416,31 @@ class CircuitBreaker:
         metrics: Optional[MetricsCollectorProtocol] = None,
     ):
         self._failure_threshold = failure_threshold
-        self._recovery_timeout = timedelta(seconds=recovery_timeout)
+        self._recovery_timeout_s = recovery_timeout
         self._half_open_max_calls = half_open_max_calls
         self._logger = logger or StructuredLogger()
         self._metrics = metrics or InMemoryMetricsCollector()
         self._state = CircuitBreakerState()
+        # 状態遷移（読み出し→更新）のみ排他。_transition_to_*はロック保持中に呼ぶ
+        self._state_lock = threading.Lock()
     
     @property
     def state(self) -> CircuitState:
         return self._state.state
     
     def can_execute(self) -> bool:
-        self._check_state_transition()
-        return self._state.state != CircuitState.OPEN
+        # 通常時（CLOSED）はロックなしで判定（属性の読み出しはアトミック）
+        if self._state.state is CircuitState.CLOSED:
+            return True
+        with self._state_lock:
+            self._check_state_transition()
+            return self._state.state != CircuitState.OPEN
     
     def _check_state_transition(self) -> None:
         if self._state.state == CircuitState.OPEN:
-            if self._state.last_failure_time:
-                elapsed = datetime.now() - self._state.last_failure_time
-                if elapsed >= self._recovery_timeout:
+            if self._state.last_failure_monotonic:
+                elapsed = time.monotonic() - self._state.last_failure_monotonic
+                if elapsed >= self._recovery_timeout_s:
                     self._transition_to_half_open()
     
     def _transition_to_half_open(self) -> None:
@@ -400,12 +449,13 @@ class CircuitBreaker:
         self._logger.info("Circuit Breaker: OPEN -> HALF_OPEN")
     
     def record_success(self) -> None:
-        if self._state.state == CircuitState.HALF_OPEN:
-            self._state.half_open_call_count += 1
-            if self._state.half_open_call_count >= self._half_open_max_calls:
-                self._transition_to_closed()
-        elif self._state.state == CircuitState.CLOSED:
-            self._state.failure_count = 0
+        with self._state_lock:
+            if self._state.state == CircuitState.HALF_OPEN:
+                self._state.half_open_call_count += 1
+                if self._state.half_open_call_count >= self._half_open_max_calls:
+                    self._transition_to_closed()
+            elif self._state.state == CircuitState.CLOSED:
+                self._state.failure_count = 0
     
     def _transition_to_closed(self) -> None:
         self._state.state = CircuitState.CLOSED
@@ -414,13 +464,17 @@ class CircuitBreaker:
         self._logger.info("Circuit Breaker: HALF_OPEN -> CLOSED")
     
     def record_failure(self) -> None:
-        self._state.failure_count += 1
-        self._state.last_failure_time = datetime.now()
-        
-        if self._state.state == CircuitState.HALF_OPEN:
-            self._transition_to_open()
-        elif self._state.failure_count >= self._failure_threshold:
-            self._transition_to_open()
+        with self._state_lock:
+            self._state.failure_count += 1
+            self._state.last_failure_monotonic = time.monotonic()
+            
+            if self._state.state == CircuitState.HALF_OPEN:
+                self._transition_to_open()
+            elif (
+                self._state.state == CircuitState.CLOSED
+                and self._state.failure_count >= self._failure_threshold
+            ):
+                self._transition_to_open()
     
     def _transition_to_open(self) -> None:
         previous_state = self._state.state.name
@@ -500,6 +554,44 @@ class RetryPolicy:
             f"{operation_name}: {self._max_attempts}回のリトライ失敗",
         ) from last_exception
     
+    async def execute_with_retry_async(
+        self,
+        operation: Callable[[], Awaitable[T]],
+        operation_name: str = "operation",
+    ) -> T:
+        """非同期版（待機中もイベントループをブロックしない）"""
+        attempt = 0
+        last_exception: Optional[Exception] = None
+        
+        while attempt < self._max_attempts:
+            attempt += 1
+            
+            try:
+                result = await operation()
+                if attempt > 1:
+                    self._logger.info(
+                        f"{operation_name}: 成功 (attempt {attempt})"
+                    )
+                return result
+                
+            except Exception as e:
+                last_exception = e
+                self._logger.warning(
+                    f"{operation_name}: 失敗 (attempt {attempt}/{self._max_attempts})"
+                    f" - {type(e).__name__}: {str(e)[:100]}"
+                )
+                
+                if attempt >= self._max_attempts:
+                    break
+                
+                delay = self._calculate_delay(attempt)
+                self._logger.info(f"{operation_name}: {delay:.2f}秒後にリトライ...")
+                await asyncio.sleep(delay)
+        
+        raise RetryExhaustedException(
+            f"{operation_name}: {self._max_attempts}回のリトライ失敗",
+        ) from last_exception
+    
     def _calculate_delay(self, attempt: int) -> float:
         delay = self._base_delay * (self._exponential_base ** (attempt - 1))
         delay = min(delay, self._max_delay)
@@ -513,23 +605,27 @@ class RetryPolicy:
 # ドメイン層: バリデーター
 # ============================================================================
 
+_WS_RE: Final[re.Pattern[str]] = re.compile(r"\s+")
+
+
 class ProductValidator:
     """商品データバリデーター"""
     
-    # 価格抽出パターン（優先順位順）
-    PRICE_PATTERNS: List[str] = [
+    # 価格抽出パターン（優先順位順・クラス定義時にコンパイル）
+    # 1つの選択に結合すると、各パターンを個別に走査した場合とマッチ位置が変わるため個別に適用する
+    _PRICE_PATTERNS: Final[Tuple[re.Pattern[str], ...]] = tuple(re.compile(p) for p in (
         r"(\d{1,3}(?:,\d{3})*(?:\.\d+)?)（税込）",
         r"(\d{1,3}(?:,\d{3})*(?:\.\d+)?)円",
         r"¥(\d{1,3}(?:,\d{3})*(?:\.\d+)?)",
         r"(\d{1,3}(?:,\d{3})*(?:\.\d+)?)税込",
         r"(\d{1,3}(?:,\d{3})*)",  # 最終手段
-    ]
+    ))
     
     @classmethod
     def validate_price(cls, price_text: str) -> Optional[int]:
         """価格バリデーション"""
-        for pattern in cls.PRICE_PATTERNS:
-            matches = re.findall(pattern, price_text)
+        for pattern in cls._PRICE_PATTERNS:
+            matches = pattern.findall(price_text)
             if matches:
                 # 最後にマッチした価格を使用
                 price_str = matches[-1].replace(",", "").replace(".", "")
@@ -544,7 +640,7 @@ class ProductValidator:
     @staticmethod
     def validate_name(name: str) -> Optional[str]:
         """商品名バリデーション"""
-        name = re.sub(r"\s+", " ", name).strip()
+        name = _WS_RE.sub(" ", name).strip()
         if Constants.MIN_PRODUCT_NAME_LENGTH <= len(name) <= Constants.MAX_PRODUCT_NAME_LENGTH:
             return name
         return None
@@ -574,12 +670,12 @@ class OhbayashiHtmlParser:
     
     def parse(self, html: str) -> List[ProductData]:
         """HTML解析・商品抽出"""
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, Constants.HTML_PARSER)
         products: List[ProductData] = []
         seen_names: set = set()
         
         # 商品リンクを探す（/view/item/ を含むリンク）
-        product_links = soup.find_all("a", href=lambda x: x and "/view/item/" in x)
+        product_links = soup.select('a[href*="/view/item/"]')
         
         self._logger.debug(f"商品リンク数: {len(product_links)}")
         
@@ -590,6 +686,10 @@ class OhbayashiHtmlParser:
                 seen_names.add(product.name)
                 rank += 1
                 products.append(product)
+                
+                # 上限到達後のリンクは価格抽出せず打ち切り
+                if len(products) >= Constants.MAX_PRODUCTS:
+                    break
         
         return products
     
@@ -623,20 +723,22 @@ class OhbayashiHtmlParser:
     
     def _extract_price_from_context(self, link: Tag) -> Optional[int]:
         """コンテキストから価格抽出"""
-        # 親要素を3階層まで探索
-        current = link
-        for _ in range(5):
-            if current.parent:
-                current = current.parent
-                text = current.get_text()
-                price = self._validator.validate_price(text)
-                if price:
-                    return price
+        # 親要素をPRICE_SEARCH_MAX_DEPTH階層まで探索（内側から、見つかった時点で終了）
+        prev_len = -1
+        for ancestor in itertools.islice(link.parents, Constants.PRICE_SEARCH_MAX_DEPTH):
+            text = ancestor.get_text()
+            # 親のテキストは子のテキストを含むため、長さが同じなら内容も同じ（検証済み）
+            if len(text) == prev_len:
+                continue
+            prev_len = len(text)
+            price = self._validator.validate_price(text)
+            if price:
+                return price
         
-        # 次の兄弟要素から探索
+        # 次の兄弟要素から探索（タグはマークアップではなくテキストのみを対象）
         next_sibling = link.next_sibling
         while next_sibling:
-            sibling_text = str(next_sibling)
+            sibling_text = next_sibling.get_text() if isinstance(next_sibling, Tag) else str(next_sibling)
             price = self._validator.validate_price(sibling_text)
             if price:
                 return price
@@ -671,6 +773,29 @@ class OhbayashiHtmlParser:
 # インフラストラクチャ層: HTTPクライアント
 # ============================================================================
 
+def _create_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=Constants.HTTP_POOL_CONNECTIONS,
+        pool_maxsize=Constants.HTTP_POOL_MAXSIZE,
+        max_retries=0,  # リトライはRetryPolicyで実施
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({
+        "User-Agent": Constants.USER_AGENT,
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "ja,en-US;q=0.7,en;q=0.3",
+        "Accept-Encoding": "gzip, deflate, br",
+        "Connection": "keep-alive",
+    })
+    return session
+
+
+# プロセス内で共有（scrape()を繰り返し呼ぶ場合もkeep-alive接続を再利用）
+_SHARED_SESSION: Final[requests.Session] = _create_session()
+
+
 class HttpClient:
     """HTTPクライアント"""
     
@@ -678,17 +803,11 @@ class HttpClient:
         self,
         timeout: int = Constants.REQUEST_TIMEOUT_SECONDS,
         logger: Optional[LoggerProtocol] = None,
+        session: Optional[requests.Session] = None,
     ):
         self._timeout = timeout
         self._logger = logger or StructuredLogger()
-        self._session = requests.Session()
-        self._session.headers.update({
-            "User-Agent": Constants.USER_AGENT,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "ja,en-US;q=0.7,en;q=0.3",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-        })
+        self._session = session or _SHARED_SESSION
     
     def get(self, url: str) -> str:
         """GETリクエスト"""
@@ -697,9 +816,14 @@ class HttpClient:
         response.raise_for_status()
         return response.text
     
+    async def get_async(self, url: str) -> str:
+        """GETリクエスト（ワーカースレッドで実行）"""
+        return await asyncio.to_thread(self.get, url)
+    
     def close(self) -> None:
-        """セッション終了"""
-        self._session.close()
+        """セッション終了（共有セッションは閉じない）"""
+        if self._session is not _SHARED_SESSION:
+            self._session.close()
 
 
 # ============================================================================
@@ -739,8 +863,18 @@ class OhbayashiScraper:
         self._http_client = HttpClient(logger=self._logger)
     
     def scrape(self) -> ScrapeResult:
-        """スクレイピング実行"""
-        correlation_id = str(uuid.uuid4())[:8]
+        """スクレイピング実行（同期ラッパー）。イベントループ実行中に呼ばれた場合は別スレッドで実行する"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.scrape_async())
+        # 実行中のループ内ではasyncio.runを使えないため、専用スレッドで新しいループを回す
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self.scrape_async()).result()
+    
+    async def scrape_async(self) -> ScrapeResult:
+        """スクレイピング実行（複数店舗を同一イベントループで並行実行可能）"""
+        correlation_id = _new_correlation_id()
         self._logger.set_correlation_id(correlation_id)
         
         start_time = time.time()
@@ -759,7 +893,7 @@ class OhbayashiScraper:
                     correlation_id=correlation_id,
                 )
             
-            products = self._retry_policy.execute_with_retry(
+            products = await self._retry_policy.execute_with_retry_async(
                 operation=self._scrape_with_protection,
                 operation_name="scrape_page",
             )
@@ -813,18 +947,15 @@ class OhbayashiScraper:
                 exit_code=ScraperExitCode.FAILURE,
                 correlation_id=correlation_id,
             )
-        
-        finally:
-            self._http_client.close()
     
-    def _scrape_with_protection(self) -> List[ProductData]:
+    async def _scrape_with_protection(self) -> List[ProductData]:
         """保護付きスクレイピング"""
         with self._circuit_breaker.protect():
-            return self._scrape_page()
+            return await self._scrape_page()
     
-    def _scrape_page(self) -> List[ProductData]:
+    async def _scrape_page(self) -> List[ProductData]:
         """ページスクレイピング"""
-        html = self._http_client.get(self._search_url)
+        html = await self._http_client.get_async(self._search_url)
         return self._parser.parse(html)
 
 
@@ -837,16 +968,17 @@ class OutputFormatter:
     
     @staticmethod
     def print_results(result: ScrapeResult) -> None:
-        """結果出力"""
-        for product in result.products:
-            print(product.to_output_line())
-        
+        """結果出力（商品行とステータス行を1回の書き込みで出力）"""
         if result.success and len(result.products) >= 20:
-            print("SUCCESS")
+            status = "SUCCESS"
         elif result.success and len(result.products) > 0:
-            print("PARTIAL SUCCESS")
+            status = "PARTIAL SUCCESS"
         else:
-            print(f"ERROR: {result.error_message or 'Unknown error'}")
+            status = f"ERROR: {result.error_message or 'Unknown error'}"
+        
+        lines = [f"{product.to_output_line()}\n" for product in result.products]
+        lines.append(f"{status}\n")
+        sys.stdout.write("".join(lines))
 
 
 # ============================================================================
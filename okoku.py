@@ -24,6 +24,42 @@ ADR-002: セレクタベース解析の改善
 - Context: p.name + p.price の兄弟要素関係に依存
 - Decision: より堅牢なセレクタベース解析を実装
 
+ADR-003: lxml.html + XPathによる解析
+=========================================
+- Status: ACCEPTED
+- Context: 必要なのはp.name/p.priceの2クラスのみで、bs4のTagラッパー生成が
+           解析時間の大半を占めていた
+- Decision: lxml導入時はコンパイル済みXPathで直接テキストを抽出し、
+            未導入時・lxmlが受け付けない入力ではSoupStrainer経由のbs4解析を使用
+- Consequences:
+  + 解析段のPythonオブジェクト生成を削減
+  + 名前と価格の対応付けは両経路で共通（_pair_name_price）
+
+ADR-004: ストリーミング解析
+=========================================
+- Status: ACCEPTED
+- Context: レスポンス全体の受信完了まで解析を開始できず、
+           bytes・str・DOMが同時にメモリ上に存在していた
+- Decision: lxml導入時はstream=Trueで受信し、HTMLPullParserへ
+            チャンク単位で投入、p要素の終了イベントごとに抽出・clear()
+- Consequences:
+  + 受信と解析がオーバーラップ
+  + MAX_PRODUCTS到達時点で受信を打ち切り
+  + 受信途中のエラーも取得・解析単位でリトライされる
+
+ADR-005: 正規表現による高速抽出パス
+=========================================
+- Status: ACCEPTED
+- Context: ページ構造（p.name内のa → p.price内のstrong）が安定しており、
+           監視用途の定期実行ではツリー構築自体が不要
+- Decision: 生HTMLから商品名・価格を1つの正規表現で抽出し、
+  FAST_PARSE_MIN_PRODUCTS件以上取れた場合のみ採用。
+  未満ならDOMパースへフォールバック（既定は無効、OKOKU_FAST_PARSE=1で有効化）
+- Consequences: 有効時はDOM構築を省略。ただしDOMパースと結果が一致しないため既定では無効
+  （class属性の完全一致のみ対応、子要素を含むa/strongは取得不可、
+  マッチしない商品は10件以上取れた時点で欠落する）。
+  高速パスは本文全体を受信してから抽出するため、有効時はストリーミング解析（ADR-004）を使用しない
+
 【SLI/SLO定義】
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 - SLI: 商品取得成功率
@@ -33,6 +69,8 @@ ADR-002: セレクタベース解析の改善
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 - requests: ^2.31.0
 - beautifulsoup4: ^4.12.0
+- soupsieve: ^2.5（beautifulsoup4の依存）
+- lxml: ^5.0.0（任意・未導入時はhtml.parser）
 """
 
 from __future__ import annotations
@@ -43,11 +81,11 @@ import os
 import random
 import re
 import sys
+import threading
 import time
-import uuid
 from contextlib import contextmanager
+from html import unescape
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
 from enum import Enum, auto
 from typing import (
     Any,
@@ -55,15 +93,26 @@ from typing import (
     Dict,
     Final,
     Generator,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Protocol,
+    Sequence,
     Tuple,
     TypeVar,
 )
 
 import requests
-from bs4 import BeautifulSoup, Tag
+import soupsieve
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+    _HAS_LXML = True
+except ImportError:
+    _HAS_LXML = False
 
 # ============================================================================
 # 型定義
@@ -103,6 +152,12 @@ class Constants:
     
     # HTTP
     REQUEST_TIMEOUT_SECONDS: Final[int] = 15
+    STREAM_CHUNK_BYTES: Final[int] = 16384
+    HTTP_POOL_CONNECTIONS: Final[int] = 4
+    HTTP_POOL_MAXSIZE: Final[int] = 32
+    
+    # HTMLパーサー（lxml未導入時はhtml.parserにフォールバック）
+    HTML_PARSER: Final[str] = "lxml" if _HAS_LXML else "html.parser"
     
     # バリデーション
     MIN_VALID_PRICE: Final[int] = 100
@@ -112,6 +167,10 @@ class Constants:
     # 取得上限
     MAX_PRODUCTS: Final[int] = 100
     
+    # 正規表現による高速抽出（DOMパースと結果が一致しないため既定は無効、ADR-005参照）
+    FAST_PARSE_ENABLED: Final[bool] = os.environ.get("OKOKU_FAST_PARSE", "0") == "1"
+    FAST_PARSE_MIN_PRODUCTS: Final[int] = 10
+    
     # User Agent
     USER_AGENT: Final[str] = (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -141,6 +200,11 @@ class ScraperExitCode(Enum):
 # データクラス
 # ============================================================================
 
+def _new_correlation_id() -> str:
+    """ログ突合用の短いID（暗号強度は不要なためMTで生成、システムコールなし）"""
+    return random.randbytes(4).hex()
+
+
 @dataclass(frozen=True, slots=True)
 class ProductData:
     """商品データ"""
@@ -151,29 +215,29 @@ class ProductData:
     
     @classmethod
     def create(cls, name: str, price: int, rank: int = 0) -> ProductData:
-        product_hash = hashlib.md5(f"{name}_{price}".encode("utf-8")).hexdigest()[:8]
+        product_hash = hashlib.blake2b(f"{name}_{price}".encode("utf-8"), digest_size=4).hexdigest()
         return cls(name=name, price=price, product_hash=product_hash, rank=rank)
     
     def to_output_line(self) -> str:
         return f"{self.name} {self.price}円"
 
 
-@dataclass
+@dataclass(slots=True)
 class CircuitBreakerState:
     state: CircuitState = CircuitState.CLOSED
     failure_count: int = 0
-    last_failure_time: Optional[datetime] = None
+    last_failure_monotonic: float = 0.0  # time.monotonic()、0.0は未失敗
     half_open_call_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapeResult:
     success: bool
     products: List[ProductData]
     error_message: Optional[str] = None
     duration_seconds: float = 0.0
     exit_code: ScraperExitCode = ScraperExitCode.SUCCESS
-    correlation_id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    correlation_id: str = field(default_factory=_new_correlation_id)
 
 
 # ============================================================================
@@ -182,7 +246,7 @@ class ScrapeResult:
 
 class ScraperException(Exception):
     def __init__(self, message: str, correlation_id: Optional[str] = None):
-        self.correlation_id = correlation_id or str(uuid.uuid4())[:8]
+        self.correlation_id = correlation_id or _new_correlation_id()
         super().__init__(f"[{self.correlation_id}] {message}")
 
 
@@ -216,17 +280,22 @@ class StructuredLogger:
     def _format(self, msg: str) -> str:
         return f"[{self._correlation_id}] {msg}" if self._correlation_id else msg
     
+    # 無効なレベルではメッセージ整形自体を行わない
     def debug(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        self._logger.debug(self._format(msg), *args, **kwargs)
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(self._format(msg), *args, **kwargs)
     
     def info(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        self._logger.info(self._format(msg), *args, **kwargs)
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(self._format(msg), *args, **kwargs)
     
     def warning(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        self._logger.warning(self._format(msg), *args, **kwargs)
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._logger.warning(self._format(msg), *args, **kwargs)
     
     def error(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        self._logger.error(self._format(msg), *args, **kwargs)
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._logger.error(self._format(msg), *args, **kwargs)
 
 
 # ============================================================================
@@ -241,38 +310,56 @@ class CircuitBreaker:
         logger: Optional[LoggerProtocol] = None,
     ):
         self._failure_threshold = failure_threshold
-        self._recovery_timeout = timedelta(seconds=recovery_timeout)
+        self._recovery_timeout_s = recovery_timeout
         self._logger = logger or StructuredLogger()
         self._state = CircuitBreakerState()
+        # 状態遷移（読み出し→更新）のみ排他。_transition_toはロック保持中に呼ぶ
+        self._state_lock = threading.Lock()
     
     def can_execute(self) -> bool:
-        self._check_transition()
-        return self._state.state != CircuitState.OPEN
+        # 通常時（CLOSED）はロックなしで判定（属性の読み出しはアトミック）
+        if self._state.state is CircuitState.CLOSED:
+            return True
+        with self._state_lock:
+            self._check_transition()
+            return self._state.state is not CircuitState.OPEN
     
     def _check_transition(self) -> None:
-        if self._state.state == CircuitState.OPEN and self._state.last_failure_time:
-            if datetime.now() - self._state.last_failure_time >= self._recovery_timeout:
-                self._state.state = CircuitState.HALF_OPEN
-                self._state.half_open_call_count = 0
-                self._logger.info("Circuit Breaker: OPEN -> HALF_OPEN")
+        if self._state.state is CircuitState.OPEN and self._state.last_failure_monotonic:
+            if time.monotonic() - self._state.last_failure_monotonic >= self._recovery_timeout_s:
+                self._transition_to(CircuitState.HALF_OPEN)
+    
+    def _transition_to(self, new_state: CircuitState) -> CircuitState:
+        """状態を遷移させ、遷移前の状態を返す"""
+        previous = self._state.state
+        self._state.state = new_state
+        if new_state is CircuitState.HALF_OPEN:
+            self._state.half_open_call_count = 0
+        elif new_state is CircuitState.CLOSED:
+            self._state.failure_count = 0
+        log = self._logger.warning if new_state is CircuitState.OPEN else self._logger.info
+        log(f"Circuit Breaker: {previous.name} -> {new_state.name}")
+        return previous
     
     def record_success(self) -> None:
-        if self._state.state == CircuitState.HALF_OPEN:
-            self._state.half_open_call_count += 1
-            if self._state.half_open_call_count >= 3:
-                self._state.state = CircuitState.CLOSED
+        with self._state_lock:
+            if self._state.state is CircuitState.HALF_OPEN:
+                self._state.half_open_call_count += 1
+                if self._state.half_open_call_count >= 3:
+                    self._transition_to(CircuitState.CLOSED)
+            elif self._state.state is CircuitState.CLOSED:
                 self._state.failure_count = 0
-                self._logger.info("Circuit Breaker: HALF_OPEN -> CLOSED")
-        elif self._state.state == CircuitState.CLOSED:
-            self._state.failure_count = 0
     
     def record_failure(self) -> None:
-        self._state.failure_count += 1
-        self._state.last_failure_time = datetime.now()
-        
-        if self._state.state == CircuitState.HALF_OPEN or self._state.failure_count >= self._failure_threshold:
-            self._state.state = CircuitState.OPEN
-            self._logger.warning("Circuit Breaker: -> OPEN")
+        with self._state_lock:
+            self._state.failure_count += 1
+            self._state.last_failure_monotonic = time.monotonic()
+            
+            if self._state.state is CircuitState.HALF_OPEN or (
+                self._state.state is CircuitState.CLOSED
+                and self._state.failure_count >= self._failure_threshold
+            ):
+                self._transition_to(CircuitState.OPEN)
     
     @contextmanager
     def protect(self) -> Generator[None, None, None]:
@@ -314,9 +401,9 @@ class RetryPolicy:
                 self._logger.warning(f"{operation_name}: 失敗 (attempt {attempt}/{self._max_attempts})")
                 
                 if attempt < self._max_attempts:
-                    delay = min(self._base_delay * (2 ** (attempt - 1)), self._max_delay)
-                    delay += random.uniform(-delay * 0.25, delay * 0.25)
-                    time.sleep(max(0.1, delay))
+                    # Full Jitter: 0〜指数バックオフ上限の一様分布（同時リトライを分散）
+                    delay = random.uniform(0, min(self._base_delay * (2 ** (attempt - 1)), self._max_delay))
+                    time.sleep(delay)
         
         raise RetryExhaustedException(f"{operation_name}: リトライ失敗") from last_exception
 
@@ -325,23 +412,25 @@ class RetryPolicy:
 # バリデーター
 # ============================================================================
 
+_WS_RE: Final[re.Pattern[str]] = re.compile(r"\s+")
+# カンマ・円・¥・半角/全角スペース
+_PRICE_CHAR_DROP: Final[Dict[int, None]] = str.maketrans("", "", ",円¥ \u3000")
+
+
 class ProductValidator:
     @staticmethod
     def validate_price(price_text: str) -> Optional[int]:
         """価格バリデーション"""
-        # カンマ、円、¥を除去して数値抽出
-        cleaned = price_text.replace(",", "").replace("円", "").replace("¥", "").strip()
-        try:
-            price = int(cleaned)
-            if Constants.MIN_VALID_PRICE <= price <= Constants.MAX_VALID_PRICE:
-                return price
-        except ValueError:
-            pass
-        return None
+        # カンマ、円、¥、空白を除去して数値抽出（数字以外が残れば例外を経ずに棄却）
+        cleaned = price_text.translate(_PRICE_CHAR_DROP).strip()
+        if not cleaned.isdecimal():
+            return None
+        price = int(cleaned)
+        return price if Constants.MIN_VALID_PRICE <= price <= Constants.MAX_VALID_PRICE else None
     
     @staticmethod
     def validate_name(name: str) -> Optional[str]:
-        name = re.sub(r"\s+", " ", name).strip()
+        name = _WS_RE.sub(" ", name).strip()
         return name if len(name) >= Constants.MIN_PRODUCT_NAME_LENGTH else None
 
 
@@ -349,16 +438,40 @@ class ProductValidator:
 # HTTPクライアント
 # ============================================================================
 
+def _create_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=Constants.HTTP_POOL_CONNECTIONS,
+        pool_maxsize=Constants.HTTP_POOL_MAXSIZE,
+        max_retries=0,  # リトライはRetryPolicyで実施
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({
+        "User-Agent": Constants.USER_AGENT,
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "ja,en-US;q=0.7,en;q=0.3",
+        "Connection": "keep-alive",
+    })
+    # ストリーミングはHttpClient.stream()でのみ明示的に使用
+    session.stream = False
+    return session
+
+
+# プロセス内で共有（scrape()を繰り返し呼ぶ場合もkeep-alive接続を再利用）
+_SHARED_SESSION: Final[requests.Session] = _create_session()
+
+
 class HttpClient:
-    def __init__(self, timeout: int = Constants.REQUEST_TIMEOUT_SECONDS, logger: Optional[LoggerProtocol] = None):
+    def __init__(
+        self,
+        timeout: int = Constants.REQUEST_TIMEOUT_SECONDS,
+        logger: Optional[LoggerProtocol] = None,
+        session: Optional[requests.Session] = None,
+    ):
         self._timeout = timeout
         self._logger = logger or StructuredLogger()
-        self._session = requests.Session()
-        self._session.headers.update({
-            "User-Agent": Constants.USER_AGENT,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "ja,en-US;q=0.7,en;q=0.3",
-        })
+        self._session = session or _SHARED_SESSION
     
     def get(self, url: str) -> str:
         self._logger.debug(f"GET: {url}")
@@ -366,70 +479,196 @@ class HttpClient:
         response.raise_for_status()
         return response.text
     
+    @contextmanager
+    def stream(self, url: str) -> Generator[requests.Response, None, None]:
+        """本文を未受信のままレスポンスを返す（ブロック終了時に接続を解放）"""
+        self._logger.debug(f"GET(stream): {url}")
+        response = self._session.get(url, timeout=self._timeout, stream=True)
+        try:
+            response.raise_for_status()
+            yield response
+        finally:
+            response.close()
+    
     def close(self) -> None:
-        self._session.close()
+        # 共有セッションは閉じない
+        if self._session is not _SHARED_SESSION:
+            self._session.close()
 
 
 # ============================================================================
 # HTMLパーサー
 # ============================================================================
 
+# <p class="name"><a ...>商品名</a></p> 直後の <p class="price"><strong>価格</strong>
+_PAIR_RE: Final[re.Pattern[str]] = re.compile(
+    r'<p\b[^>]*\bclass="name"[^>]*>\s*<a\b[^>]*>(?P<name>[^<]*)</a>\s*</p>\s*'
+    r'<p\b[^>]*\bclass="price"[^>]*>\s*<strong\b[^>]*>(?P<price>[^<]*)</strong>'
+)
+
+
 class OkokuHtmlParser:
     """買取王国HTML解析器"""
     
+    # 商品名・価格のp要素のみをツリー化（それ以外のタグは構築しない）
+    _STRAINER: Final[SoupStrainer] = SoupStrainer("p", class_=["name", "price"])
+    # コンパイル済みセレクタ（セレクタリストの結果は文書順）
+    _SEL_PARAGRAPHS: Final[soupsieve.SoupSieve] = soupsieve.compile("p.name, p.price")
+    
+    if _HAS_LXML:
+        # class属性のトークン一致（bs4のclass_指定と同じ判定）
+        _XP_PARAGRAPHS = etree.XPath(
+            "//p[contains(concat(' ', normalize-space(@class), ' '), ' name ')"
+            " or contains(concat(' ', normalize-space(@class), ' '), ' price ')]"
+        )
+        _XP_FIRST_A = etree.XPath("(.//a)[1]")
+        _XP_FIRST_STRONG = etree.XPath("(.//strong)[1]")
+        _XP_TEXTS = etree.XPath(".//text()")
+    
     def __init__(self, validator: ProductValidator, logger: Optional[LoggerProtocol] = None):
         self._validator = validator
         self._logger = logger or StructuredLogger()
     
     def parse(self, html: str) -> List[ProductData]:
-        soup = BeautifulSoup(html, "html.parser")
-        products: List[ProductData] = []
+        if Constants.FAST_PARSE_ENABLED:
+            products = self._build_products(
+                (unescape(m["name"]), unescape(m["price"])) for m in _PAIR_RE.finditer(html)
+            )
+            if len(products) >= Constants.FAST_PARSE_MIN_PRODUCTS:
+                return products
+            self._logger.debug(f"高速パス{len(products)}件のためDOMパースへフォールバック")
+        return self._build_products(self._pair_name_price(self._iter_paragraphs(html)))
+    
+    def parse_stream(self, chunks: Iterable[bytes], encoding: Optional[str] = None) -> List[ProductData]:
+        """バイト列チャンクを逐次解析（lxml必須）
         
-        # 商品名要素を取得
-        name_elements = soup.find_all("p", class_="name")
-        self._logger.debug(f"商品名要素数: {len(name_elements)}")
+        encodingがNoneの場合はlxmlがmetaタグ等から判定する
+        """
+        parser = etree.HTMLPullParser(events=("end",), tag="p", encoding=encoding)
+        return self._build_products(self._pair_name_price(self._iter_stream_paragraphs(parser, chunks)))
+    
+    def _build_products(self, rows: Iterable[Tuple[Optional[str], Optional[str]]]) -> List[ProductData]:
+        products: List[ProductData] = []
+        rank = 0
         
-        for rank, name_elem in enumerate(name_elements, start=1):
-            product = self._parse_product(name_elem, rank)
+        for rank, (name_raw, price_text) in enumerate(rows, start=1):
+            # 想定外の例外のみ捕捉（通常の不正データはNoneで棄却）。
+            # 受信・解析エラーはリトライ対象のため、rowsの走査自体は囲まない
+            try:
+                product = self._build_product(name_raw, price_text, rank)
+            except Exception as e:
+                self._logger.warning(f"商品解析エラー (rank {rank}): {e}")
+                continue
             if product:
                 products.append(product)
             
-            # 上限チェック
+            # 上限チェック（ストリーミング時は以降の受信も打ち切られる）
             if len(products) >= Constants.MAX_PRODUCTS:
                 break
         
+        self._logger.debug(f"商品名要素数: {rank}")
         return products
     
-    def _parse_product(self, name_elem: Tag, rank: int) -> Optional[ProductData]:
+    def _iter_paragraphs(self, html: str) -> Iterator[Tuple[Sequence[str], Optional[str]]]:
+        """(class一覧, 商品名aまたは価格strongのテキスト)を文書順に列挙"""
+        if _HAS_LXML and html.strip():
+            try:
+                tree = lxml_html.fromstring(html)
+            except (etree.ParserError, ValueError) as e:
+                # エンコーディング宣言付き文字列など、lxmlが受け付けない入力
+                self._logger.debug(f"lxml解析不可、bs4にフォールバック: {e}")
+            else:
+                for p in self._XP_PARAGRAPHS(tree):
+                    classes = (p.get("class") or "").split()
+                    yield classes, self._lxml_paragraph_text(classes, p)
+                return
+        
+        soup = BeautifulSoup(html, Constants.HTML_PARSER, parse_only=self._STRAINER)
+        for p in self._SEL_PARAGRAPHS.select(soup):
+            classes = p.get("class") or ()
+            child = p.find("a" if "name" in classes else "strong")
+            yield classes, self._soup_text(child) if child else None
+    
+    @staticmethod
+    def _soup_text(tag: Tag) -> str:
+        """get_text(strip=True)と同じ結果を返す（テキスト1つだけの要素は走査を省略）"""
+        string = tag.string
+        # Comment等のサブクラスはget_textの対象外のため厳密な型で判定
+        if type(string) is NavigableString:
+            return string.strip()
+        return tag.get_text(strip=True)
+    
+    def _iter_stream_paragraphs(
+        self, parser: Any, chunks: Iterable[bytes]
+    ) -> Iterator[Tuple[Sequence[str], Optional[str]]]:
+        for chunk in chunks:
+            parser.feed(chunk)
+            yield from self._drain_events(parser)
         try:
-            # 商品名
-            name_link = name_elem.find("a")
-            if not name_link:
-                return None
-            
-            name_raw = name_link.get_text(strip=True)
-            name = self._validator.validate_name(name_raw)
-            if not name:
-                return None
-            
-            # 価格（兄弟要素から取得）
-            price_tag = name_elem.find_next_sibling("p", class_="price")
-            if not price_tag:
-                return None
-            
-            price_strong = price_tag.find("strong")
-            if not price_strong:
-                return None
-            
-            price_text = price_strong.get_text(strip=True)
-            price = self._validator.validate_price(price_text)
-            if price is None:
-                return None
-            
-            return ProductData.create(name=name, price=price, rank=rank)
-            
-        except Exception:
+            parser.close()
+        except etree.XMLSyntaxError:
+            # 空レスポンス
+            return
+        yield from self._drain_events(parser)
+    
+    def _drain_events(self, parser: Any) -> Iterator[Tuple[Sequence[str], Optional[str]]]:
+        for _, p in parser.read_events():
+            classes = (p.get("class") or "").split()
+            if "name" in classes or "price" in classes:
+                text = self._lxml_paragraph_text(classes, p)
+                yield classes, text
+            # 抽出済みの子孫を破棄してメモリを一定に保つ
+            p.clear(keep_tail=True)
+    
+    def _lxml_paragraph_text(self, classes: Sequence[str], p: Any) -> Optional[str]:
+        """p.nameは最初のa、p.priceは最初のstrongのテキストをget_text(strip=True)相当で取得"""
+        found = (self._XP_FIRST_A if "name" in classes else self._XP_FIRST_STRONG)(p)
+        if not found:
             return None
+        return "".join(s.strip() for s in self._XP_TEXTS(found[0]))
+    
+    @staticmethod
+    def _pair_name_price(
+        paragraphs: Iterable[Tuple[Sequence[str], T]]
+    ) -> Iterator[Tuple[Optional[T], Optional[T]]]:
+        """p.nameと、次のp.nameより前に現れる最初のp.priceを文書順に対応付け
+        
+        絞り込みパース後は兄弟関係が平坦化されるため、find_next_siblingの代わりに使用。
+        価格を伴わない商品名は(商品名, None)として返す
+        """
+        pending = False
+        pending_name: Optional[T] = None
+        for classes, value in paragraphs:
+            if "name" in classes:
+                if pending:
+                    yield pending_name, None
+                pending, pending_name = True, value
+            elif "price" in classes and pending:
+                yield pending_name, value
+                pending, pending_name = False, None
+        if pending:
+            yield pending_name, None
+    
+    def _build_product(
+        self, name_raw: Optional[str], price_text: Optional[str], rank: int
+    ) -> Optional[ProductData]:
+        # 商品名
+        if name_raw is None:
+            return None
+        
+        name = self._validator.validate_name(name_raw)
+        if not name:
+            return None
+        
+        # 価格（商品名の直後のp.price内のstrong）
+        if price_text is None:
+            return None
+        
+        price = self._validator.validate_price(price_text)
+        if price is None:
+            return None
+        
+        return ProductData.create(name=name, price=price, rank=rank)
 
 
 # ============================================================================
@@ -454,8 +693,17 @@ class OkokuScraper:
         self._parser = OkokuHtmlParser(self._validator, self._logger)
         self._http_client = HttpClient(logger=self._logger)
     
+    def __enter__(self) -> "OkokuScraper":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        self._http_client.close()
+    
     def scrape(self) -> ScrapeResult:
-        correlation_id = str(uuid.uuid4())[:8]
+        correlation_id = _new_correlation_id()
         self._logger.set_correlation_id(correlation_id)
         start_time = time.time()
         
@@ -503,12 +751,16 @@ class OkokuScraper:
                 duration_seconds=time.time() - start_time, exit_code=ScraperExitCode.FAILURE,
                 correlation_id=correlation_id,
             )
-        
-        finally:
-            self._http_client.close()
     
     def _scrape_with_protection(self) -> List[ProductData]:
         with self._circuit_breaker.protect():
+            if _HAS_LXML and not Constants.FAST_PARSE_ENABLED:
+                with self._http_client.stream(self._start_url) as response:
+                    # Content-Typeにcharsetがない場合はlxmlの判定に任せる
+                    encoding = response.encoding if "charset" in response.headers.get("Content-Type", "") else None
+                    return self._parser.parse_stream(
+                        response.iter_content(Constants.STREAM_CHUNK_BYTES), encoding
+                    )
             html = self._http_client.get(self._start_url)
             return self._parser.parse(html)
 
@@ -520,15 +772,16 @@ class OkokuScraper:
 class OutputFormatter:
     @staticmethod
     def print_results(result: ScrapeResult) -> None:
-        for product in result.products:
-            print(product.to_output_line())
-        
         if result.success and len(result.products) >= 20:
-            print("SUCCESS")
+            status = "SUCCESS"
         elif result.success and result.products:
-            print("PARTIAL SUCCESS")
+            status = "PARTIAL SUCCESS"
         else:
-            print(f"ERROR: {result.error_message or 'Unknown error'}")
+            status = f"ERROR: {result.error_message or 'Unknown error'}"
+        
+        lines = [f"{product.to_output_line()}\n" for product in result.products]
+        lines.append(f"{status}\n")
+        sys.stdout.write("".join(lines))
 
 
 # ============================================================================
@@ -537,8 +790,8 @@ class OutputFormatter:
 
 def main() -> int:
     logger = StructuredLogger(level=getattr(logging, os.environ.get("LOG_LEVEL", "INFO").upper(), logging.INFO))
-    scraper = OkokuScraper(logger=logger)
-    result = scraper.scrape()
+    with OkokuScraper(logger=logger) as scraper:
+        result = scraper.scrape()
     OutputFormatter.print_results(result)
     return result.exit_code.value
 
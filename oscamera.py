@@ -5,13 +5,44 @@ oscamera.py 修正版
 master_controller一元管理対応: DB保存処理削除、標準出力のみ
 """
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, NavigableString
+from requests.adapters import HTTPAdapter
 from datetime import datetime
-import hashlib
 import re
+import sys
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 
 BASE_URL = "https://www.oscameraservice.com/new-product.html"
 
+# プロセス内で共有（scrape()の繰り返し呼び出しでもkeep-alive接続を再利用）
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+})
+
+# ヘッダー・フッター・お知らせ行のキーワード
+SKIP_KEYWORDS = ('OS CAMERA', 'お問い合わせ', '担当', '更新', 'gmail', '電話')
+
+# 管理番号・状態・価格表示（商品名ではない行）
+INVALID_PATTERNS = [re.compile(p) for p in (
+    r'^[A-Z]{2,3}-\d+',                  # RU-1130, AH-9597など
+    r'^\d+$',                            # 数字のみ
+    r'^特価[\d,]+$',                     # 特価17,800など
+    r'^(新同品|極上品|良品|現状渡し)(\(外観\))?$' # 状態表示
+)]
+
+PRICE_PATTERN = re.compile(r'¥?\s*(\d{1,3}(?:,\d{3})+)')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+# メーカー名の直後に英大文字が続く箇所
+MAKER_PATTERN = re.compile(r'(Nikon|Canon|Sony|Leica|MINOLTA|HASSELBLAD)([A-Z])')
+
 def scrape_oscamera():
     """OSカメラスクレイピング"""
     
@@ -20,23 +51,23 @@ def scrape_oscamera():
     products = []
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
-        response = requests.get(BASE_URL, headers=headers, timeout=15)
-        response.encoding = response.apparent_encoding
+        # BeautifulSoupにはバイト列を渡す（文字コードはmetaタグから判定されるためapparent_encodingは不要）
+        response = SESSION.get(BASE_URL, timeout=15)
         
         if response.status_code != 200:
             print(f"HTTPエラー: {response.status_code}")
             return 0
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, HTML_PARSER)
         
         # テーブル行を取得
         rows = soup.find_all('tr')
         print(f"行数: {len(rows)}個")
         
+        # 近傍行の価格探索用に各行のテキストを一度だけ取得
+        row_texts = [row.get_text() for row in rows]
+        seen = set()
+        
         # 商品情報を抽出（柔軟なパターン）
         print("商品抽出開始...")
         
@@ -47,26 +78,23 @@ def scrape_oscamera():
                 if not strong_tag:
                     continue
                 
-                name_text = strong_tag.get_text(strip=True)
+                # テキスト1つだけのstrongは走査を省略（get_text(strip=True)と同じ結果）
+                name_string = strong_tag.string
+                if type(name_string) is NavigableString:
+                    name_text = name_string.strip()
+                else:
+                    name_text = strong_tag.get_text(strip=True)
                 
                 # 短すぎる・空白のみは除外
                 if len(name_text) < 5:
                     continue
                 
                 # ヘッダー・フッター・お知らせ行を除外
-                skip_keywords = ['OS CAMERA', 'お問い合わせ', '担当', '更新', 'gmail', '電話']
-                if any(kw in name_text for kw in skip_keywords):
+                if any(kw in name_text for kw in SKIP_KEYWORDS):
                     continue
                 
                 # 管理番号・状態・価格表示を除外
-                invalid_patterns = [
-                    r'^[A-Z]{2,3}-\d+',                  # RU-1130, AH-9597など
-                    r'^\d+$',                            # 数字のみ
-                    r'^特価[\d,]+$',                     # 特価17,800など
-                    r'^(新同品|極上品|良品|現状渡し)(\(外観\))?$' # 状態表示
-                ]
-                
-                if any(re.match(pattern, name_text) for pattern in invalid_patterns):
+                if any(pattern.match(name_text) for pattern in INVALID_PATTERNS):
                     continue
                 
                 # この行の近く（前後）で価格を探す
@@ -75,11 +103,10 @@ def scrape_oscamera():
                     if idx + offset < 0 or idx + offset >= len(rows):
                         continue
                     
-                    nearby_row = rows[idx + offset]
-                    nearby_text = nearby_row.get_text()
+                    nearby_text = row_texts[idx + offset]
                     
                     # 価格パターンを探す
-                    price_match = re.search(r'¥?\s*(\d{1,3}(?:,\d{3})+)', nearby_text)
+                    price_match = PRICE_PATTERN.search(nearby_text)
                     if price_match:
                         price = price_match.group(1).replace(',', '')
                         break
@@ -88,19 +115,19 @@ def scrape_oscamera():
                     continue
                 
                 # 商品名をクリーニング（改行とスペースを整理）
-                name = re.sub(r'\s+', ' ', name_text).strip()
+                name = WHITESPACE_PATTERN.sub(' ', name_text).strip()
                 
                 # メーカー名の後に空白を追加
-                name = re.sub(r'(Nikon|Canon|Sony|Leica|MINOLTA|HASSELBLAD)([A-Z])', r'\1 \2', name)
+                name = MAKER_PATTERN.sub(r'\1 \2', name)
                 
                 if len(name) < 3:
                     continue
                 
-                product_hash = hashlib.md5(f"{name}_{price}".encode()).hexdigest()
+                key = (name, price)
                 
-                if not any(p['hash'] == product_hash for p in products):
+                if key not in seen:
+                    seen.add(key)
                     products.append({
-                        'hash': product_hash,
                         'name': name,
                         'price': price
                     })
@@ -111,10 +138,9 @@ def scrape_oscamera():
         
         print(f"総取得数: {len(products)}件")
         
-        # 商品情報を標準出力（master_controller用）
+        # 商品情報を標準出力（master_controller用）※まとめて書き出し
         if len(products) > 0:
-            for product in products:
-                print(f"{product['name']} {product['price']}円")
+            sys.stdout.write("".join(f"{product['name']} {product['price']}円\n" for product in products))
         
         # 結果判定
         if len(products) >= 10:
@@ -1,5 +1,10 @@
 from playwright.sync_api import sync_playwright
 from bs4 import BeautifulSoup
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 
 START_URL = "https://otsukashokai.co.jp/used-item-2/"
 
@@ -11,7 +16,7 @@ def scrape_all_pages():
         page.goto(START_URL, timeout=60000)
 
         while True:
-            soup = BeautifulSoup(page.content(), "html.parser")
+            soup = BeautifulSoup(page.content(), HTML_PARSER)
             for detail in soup.select("div.item_details"):
                 name_tag = detail.select_one("h2.item_name a")
                 price_tag = detail.select_one("span.price")
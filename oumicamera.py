@@ -7,6 +7,11 @@ master_controller対応版
 from playwright.sync_api import sync_playwright
 from bs4 import BeautifulSoup
 import re
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 
 START_URL = "https://oumicamera.base.shop/categories/4685722"
 
@@ -36,7 +41,7 @@ def scrape_oumicamera():
             page.evaluate("window.scrollTo(0, document.body.scrollHeight);")
             page.wait_for_timeout(1000)
 
-            soup = BeautifulSoup(page.content(), "html.parser")
+            soup = BeautifulSoup(page.content(), HTML_PARSER)
             browser.close()
 
         titles = soup.select(".items-grid_itemTitleText_5c97110f")
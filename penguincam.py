@@ -6,27 +6,41 @@ penguincam.py - ペンギンカメラスクレイパー
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 import re
+import sys
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 
 BASE_URL = "http://penguincam.shop26.makeshop.jp/shopbrand/025/P/"
 
+# プロセス内で共有（scrape_penguincam()の繰り返し呼び出しでもkeep-alive接続を再利用）
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+})
+
 def scrape_penguincam():
     results = []
     seen = set()
     
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
-        
-        response = requests.get(BASE_URL, headers=headers, timeout=15)
-        response.encoding = response.apparent_encoding
+        response = SESSION.get(BASE_URL, timeout=15)
+        # 本文全体を走査するapparent_encodingはContent-Typeにcharsetがない場合のみ使用
+        if "charset" not in response.headers.get("Content-Type", "").lower():
+            response.encoding = response.apparent_encoding
         
         if response.status_code != 200:
             print(f"エラー: ステータスコード {response.status_code}")
             return []
         
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = BeautifulSoup(response.text, HTML_PARSER)
         
         # パターン1: tbody内のtr要素を探す（グリッド表示の商品）
         all_trs = soup.find_all("tr")
@@ -128,8 +142,8 @@ def main():
         print("商品が見つかりませんでした")
         return 0
     
-    for item in items:
-        print(f"{item['name']}　{item['price']}円")
+    # まとめて書き出し
+    sys.stdout.write("".join(f"{item['name']}　{item['price']}円\n" for item in items))
     
     return len(items)
 
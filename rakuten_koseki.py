@@ -17,6 +17,18 @@ from typing import Dict, List, Optional, Tuple
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+try:
+    from selectolax.lexbor import LexborHTMLParser, LexborNode
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
 
 # ==========================================
 # 設定
@@ -50,6 +62,28 @@ HEADERS = {
     "Cache-Control": "max-age=0"
 }
 
+# 接続プール
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+
+
+def create_session() -> requests.Session:
+    """共通ヘッダーと接続プールを設定したセッションを生成
+    
+    Returns:
+        requests.Session: keep-alive接続を再利用するセッション
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(HEADERS)
+    return session
+
+
+# プロセス内で共有（リトライ・scrape()の繰り返し呼び出しでもTLS接続を再利用）
+SESSION = create_session()
+
 
 # ==========================================
 # ログ出力関数
@@ -104,9 +138,8 @@ def fetch_html_with_retry(url: str) -> Optional[str]:
                 time.sleep(delay)
             
             log_debug(f"リクエスト送信: {url}")
-            response = requests.get(
+            response = SESSION.get(
                 url,
-                headers=HEADERS,
                 timeout=REQUEST_TIMEOUT,
                 allow_redirects=True
             )
@@ -158,28 +191,26 @@ def parse_products(html: str) -> List[Dict[str, str]]:
             - hash: 商品ハッシュ（重複検知用）
     """
     try:
-        soup = BeautifulSoup(html, 'html.parser')
+        if HAS_SELECTOLAX:
+            link_pairs = extract_link_pairs_selectolax(html)
+        else:
+            link_pairs = extract_link_pairs_bs4(html)
         products = []
         
-        # 商品リンクを取得（class="category_itemnamelink"）
-        product_links = soup.find_all('a', class_='category_itemnamelink')
-        log_debug(f"商品リンク検出数: {len(product_links)}")
+        log_debug(f"商品リンク検出数: {len(link_pairs)}")
         
-        for link in product_links:
+        for name, price_text in link_pairs:
             try:
-                # 商品名取得
-                name = link.get_text(strip=True)
+                # 商品名
                 if not name:
                     log_debug("商品名が空 - スキップ")
                     continue
                 
-                # 価格取得（次の兄弟要素から）
-                price_span = link.find_next('span', class_='category_itemprice')
-                if not price_span:
+                # 価格（リンク以降で最初の価格要素）
+                if price_text is None:
                     log_debug(f"価格要素未検出: {name[:30]}... - スキップ")
                     continue
                 
-                price_text = price_span.get_text(strip=True)
                 price = extract_price(price_text)
                 
                 if price is None:
@@ -209,6 +240,78 @@ def parse_products(html: str) -> List[Dict[str, str]]:
         return []
 
 
+def extract_link_pairs_bs4(html: str) -> List[Tuple[str, Optional[str]]]:
+    """商品リンクと価格テキストの組を抽出（BeautifulSoup版）
+    
+    Args:
+        html: HTMLテキスト
+        
+    Returns:
+        List[Tuple[str, Optional[str]]]: (商品名, 価格テキスト)のリスト、価格要素なしはNone
+    """
+    soup = BeautifulSoup(html, HTML_PARSER)
+    link_pairs = []
+    
+    # 商品リンク（class="category_itemnamelink"）と、その後の最初の価格要素
+    for link in soup.find_all('a', class_='category_itemnamelink'):
+        price_span = link.find_next('span', class_='category_itemprice')
+        link_pairs.append((
+            link.get_text(strip=True),
+            price_span.get_text(strip=True) if price_span else None,
+        ))
+    
+    return link_pairs
+
+
+def extract_link_pairs_selectolax(html: str) -> List[Tuple[str, Optional[str]]]:
+    """商品リンクと価格テキストの組を抽出（selectolax版）
+    
+    Args:
+        html: HTMLテキスト
+        
+    Returns:
+        List[Tuple[str, Optional[str]]]: (商品名, 価格テキスト)のリスト、価格要素なしはNone
+    """
+    tree = LexborHTMLParser(html)
+    link_pairs = []
+    
+    for link in tree.css('a.category_itemnamelink'):
+        price_span = find_next_node(link, 'span', 'category_itemprice')
+        link_pairs.append((
+            link.text(strip=True),
+            price_span.text(strip=True) if price_span else None,
+        ))
+    
+    return link_pairs
+
+
+def find_next_node(node: "LexborNode", tag: str, class_name: str) -> Optional["LexborNode"]:
+    """文書順でnode以降にある最初の該当要素を返す（BeautifulSoupのfind_next相当）
+    
+    Args:
+        node: 起点ノード
+        tag: タグ名
+        class_name: クラス名
+        
+    Returns:
+        Optional[LexborNode]: 該当ノード、見つからない場合はNone
+    """
+    current = node
+    while True:
+        if current.child is not None:
+            current = current.child
+        else:
+            while current is not None and current.next is None:
+                current = current.parent
+            if current is None:
+                return None
+            current = current.next
+        
+        # テキストノードはタグ名で除外してから属性を参照する
+        if current.tag == tag and class_name in (current.attributes.get('class') or '').split():
+            return current
+
+
 def extract_price(price_text: str) -> Optional[int]:
     """価格テキストから数値を抽出
     
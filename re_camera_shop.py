@@ -5,10 +5,21 @@ re_camera_shop.py（URL index対応）
 master_controller一元管理対応: DB保存処理削除、標準出力のみ
 """
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, UnicodeDammit
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 import hashlib
 import re
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
 
 BASE_URLS = [
     "https://re-camera-shop.com/category/index.jsp?ctglyid=480_2",  # url_index: 0
@@ -16,54 +27,76 @@ BASE_URLS = [
     "https://re-camera-shop.com/category/index.jsp?ctglyid=376_2"   # url_index: 2
 ]
 
+# 3URLとも同一ホストのため、keep-alive接続を使い回す
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+})
+
+def extract_items(content):
+    """li.itemごとに(メーカー・商品名, 価格テキスト)を抽出（要素なしはNone）"""
+    results = []
+    
+    if HAS_SELECTOLAX:
+        # lexborはバイト列をUTF-8として扱うため、BeautifulSoupと同じ判定（metaタグ等）で復号して渡す
+        tree = LexborHTMLParser(UnicodeDammit(content, is_html=True).unicode_markup)
+        for item in tree.css("li.item"):
+            manufacturer = item.css_first("p.manufacturer")
+            price = item.css_first("p.price")
+            results.append((
+                manufacturer.text(strip=True) if manufacturer else None,
+                price.text(strip=True) if price else None,
+            ))
+        return results
+    
+    soup = BeautifulSoup(content, HTML_PARSER)
+    for item in soup.select("li.item"):
+        manufacturer = item.select_one("p.manufacturer")
+        price = item.select_one("p.price")
+        results.append((
+            manufacturer.get_text(strip=True) if manufacturer else None,
+            price.get_text(strip=True) if price else None,
+        ))
+    return results
+
 def scrape_re_camera():
     """re-camera-shopスクレイピング"""
     
     print(f"re_camera_shop 実行開始: {datetime.now()}")
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
         for url_index, url in enumerate(BASE_URLS):
             # URL切り替えを明示
             print(f"---URL_INDEX:{url_index}---")
             print(f"URL {url_index+1}/{len(BASE_URLS)} 処理中...")
             
             try:
-                response = requests.get(url, headers=headers, timeout=15)
-                response.encoding = response.apparent_encoding
+                response = SESSION.get(url, timeout=15)
                 
                 if response.status_code != 200:
                     print(f"  HTTPエラー: {response.status_code}")
                     continue
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # 商品リストを取得
-                items = soup.select("li.item")
+                # 商品リストを取得（バイト列を渡し、文字コードはmetaタグから判定）
+                items = extract_items(response.content)
                 print(f"  商品数: {len(items)}個")
                 
                 page_products = 0
                 seen_hashes = set()
                 
-                for item in items:
+                for name, price_text in items:
                     try:
                         # メーカー・商品名
-                        manufacturer_tag = item.select_one("p.manufacturer")
-                        if not manufacturer_tag:
+                        if name is None:
                             continue
                         
-                        name = manufacturer_tag.get_text(strip=True)
-                        
                         # 価格
-                        price_tag = item.select_one("p.price")
-                        if not price_tag:
+                        if price_text is None:
                             continue
                         
-                        price_text = price_tag.get_text(strip=True)
-                        
                         # 価格から数字のみ抽出
                         price_match = re.search(r'[\d,]+', price_text)
                         if price_match:
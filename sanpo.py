@@ -6,6 +6,11 @@ sanpo.py - 三宝カメラスクレイパー
 from playwright.sync_api import sync_playwright
 from bs4 import BeautifulSoup
 import re
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 
 START_URL = "https://www.sanpou.ne.jp/"
 
@@ -19,7 +24,7 @@ def scrape_page(url):
             html = page.content()
             browser.close()
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, HTML_PARSER)
 
         for cell in soup.select(".item-list td[valign='top']"):
             name_tag = cell.select_one("tr.woong a")
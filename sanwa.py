@@ -6,9 +6,15 @@ master_controller一元管理対応: DB保存処理削除、標準出力のみ
 """
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 import hashlib
 import re
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 
 BASE_URL = "http://www.camera-sanwa.co.jp"
 START_URL = BASE_URL + "/list.php?312812942"
@@ -17,6 +23,13 @@ HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
 }
 
+# プロセス内で共有（scrape()の繰り返し呼び出しでもkeep-alive接続を再利用）
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+SESSION.headers.update(HEADERS)
+
 def scrape_sanwa():
     """三和カメラスクレイピング"""
     
@@ -25,9 +38,9 @@ def scrape_sanwa():
     products = []
     
     try:
-        response = requests.get(START_URL, headers=HEADERS, timeout=15)
-        response.encoding = response.apparent_encoding
-        soup = BeautifulSoup(response.text, "html.parser")
+        response = SESSION.get(START_URL, timeout=15)
+        # バイト列を渡し、文字コード判定はBeautifulSoup側（metaタグ）に任せる
+        soup = BeautifulSoup(response.content, HTML_PARSER)
 
         rows = soup.select("#listtb tr")
         print(f"行数: {len(rows)}個")
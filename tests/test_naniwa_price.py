@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""naniwa.ProductValidator.extract_price のテスト"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from naniwa import ProductValidator
+except ImportError as e:  # playwright等が未導入の環境
+    raise unittest.SkipTest(f"naniwaの依存関係が未導入: {e}")
+
+
+class ExtractPriceTest(unittest.TestCase):
+    def test_ascii_digits(self):
+        self.assertEqual(ProductValidator.extract_price("¥12,800"), 12800)
+        self.assertEqual(ProductValidator.extract_price("￥ 12800（税込）"), 12800)
+
+    def test_fullwidth_digits(self):
+        self.assertEqual(ProductValidator.extract_price("￥１２８００"), 12800)
+        self.assertEqual(ProductValidator.extract_price("¥１２,８００"), 12800)
+
+    def test_comma_grouped_price_takes_priority(self):
+        # カンマ区切りの価格を、先に現れる数字のみの価格より優先する
+        self.assertEqual(ProductValidator.extract_price("¥980 → ¥12,800"), 12800)
+
+    def test_no_price(self):
+        self.assertIsNone(ProductValidator.extract_price("SOLD OUT"))
+        self.assertIsNone(ProductValidator.extract_price("¥"))
+
+
+if __name__ == "__main__":
+    unittest.main()